@@ -10,6 +10,7 @@ import re
 import urllib.parse
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from collections.abc import Callable
 from typing import Any
 
 import httpx
@@ -19,6 +20,17 @@ import httpx
 OWNERSHIP_MINE = 1
 OWNERSHIP_SHARED = 2
 
+# Max API client calls in flight at once, across all tool calls (the server
+# enforces it; the client's connection pool is sized to match)
+MAX_CONCURRENCY = int(os.environ.get("NOTEBOOKLM_MAX_CONCURRENCY", "8"))
+
+
+class CreateArtifactError(Exception):
+    """A studio create RPC returned no artifact."""
+
+    def __init__(self, label: str):
+        super().__init__(f"Failed to create {label}")
+
 
 @dataclass
 class ConversationTurn:
@@ -90,6 +102,7 @@ class NotebookLMClient:
     RPC_ADD_SOURCE = "izAoDd"  # Used for URL, text, and Drive sources
     RPC_GET_SOURCE = "hizoJc"  # Get source details
     RPC_CHECK_FRESHNESS = "yR9Yof"  # Check if Drive source is stale
+    FRESHNESS_BATCH_SIZE = 50  # Max freshness checks per batchexecute request
     RPC_SYNC_DRIVE = "FLmJqe"  # Sync Drive source with latest content
     RPC_DELETE_SOURCE = "tGMBJ"  # Delete a source from notebook
     RPC_GET_CONVERSATIONS = "hPTbtc"
@@ -115,6 +128,11 @@ class NotebookLMClient:
     RESULT_TYPE_GOOGLE_SLIDES = 3
     RESULT_TYPE_DEEP_REPORT = 5
     RESULT_TYPE_GOOGLE_SHEETS = 8
+    RESULT_TYPE_MIME_TYPES = {  # Drive result types -> MIME type for import
+        RESULT_TYPE_GOOGLE_DOC: "application/vnd.google-apps.document",
+        RESULT_TYPE_GOOGLE_SLIDES: "application/vnd.google-apps.presentation",
+        RESULT_TYPE_GOOGLE_SHEETS: "application/vnd.google-apps.spreadsheet",
+    }
     RPC_CREATE_STUDIO = "R7cb6c"   # Create Audio or Video Overview
     RPC_POLL_STUDIO = "gArtLc"     # Poll for studio content status
     RPC_DELETE_STUDIO = "V5N4be"   # Delete Audio or Video Overview
@@ -194,6 +212,19 @@ class NotebookLMClient:
     SOURCE_TYPE_GOOGLE_OTHER = 2
     SOURCE_TYPE_PASTED_TEXT = 4
 
+    # Connection pool for the long-lived HTTP client - tool calls run
+    # concurrently, so keep connections warm instead of re-handshaking.
+    # Sized to the server's concurrency cap (NOTEBOOKLM_MAX_CONCURRENCY)
+    # rather than opening hundreds of connections to a single host
+    HTTP_LIMITS = httpx.Limits(
+        max_keepalive_connections=MAX_CONCURRENCY,
+        max_connections=MAX_CONCURRENCY,
+        keepalive_expiry=60.0,
+    )
+
+    # Headers of the pooled client that a page navigation doesn't send
+    _RPC_ONLY_HEADERS = ("Content-Type", "Origin", "Referer", "X-Same-Domain")
+
     # Query endpoint (different from batchexecute - streaming gRPC-style)
     QUERY_ENDPOINT = "/_/LabsTailwindUi/data/google.internal.labs.tailwind.orchestration.v1.LabsTailwindOrchestrationService/GenerateFreeFormStreamed"
 
@@ -233,9 +264,11 @@ class NotebookLMClient:
         import random
         self._reqid_counter = random.randint(100000, 999999)
 
-        # ALWAYS refresh CSRF token on initialization - they expire quickly (minutes)
-        # Even if a CSRF token was provided, it may be stale
-        self._refresh_auth_tokens()
+        # Tokens missing here (not in the auth cache) are fetched from the
+        # page on the first request rather than up front. Provided tokens may
+        # be stale - they're refreshed on the first request the API rejects
+        # (see _post)
+        self._auth_stale = not (csrf_token and session_id)
 
     def _refresh_auth_tokens(self) -> None:
         """
@@ -247,51 +280,52 @@ class NotebookLMClient:
         Raises:
             ValueError: If cookies are expired (redirected to login) or tokens not found
         """
-        # Build cookie header
-        cookie_header = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        # Fetch the page over the pooled connection, with browser-like
+        # navigation headers in place of the client's RPC-only ones
+        client = self._get_client()
+        request = client.build_request(
+            "GET", f"{self.BASE_URL}/", headers=self._PAGE_FETCH_HEADERS, timeout=15.0
+        )
+        for header in self._RPC_ONLY_HEADERS:
+            request.headers.pop(header, None)
+        response = client.send(request, follow_redirects=True)
 
-        # Must use browser-like headers for page fetch
-        headers = {**self._PAGE_FETCH_HEADERS, "Cookie": cookie_header}
+        # Check if redirected to login (cookies expired)
+        if "accounts.google.com" in str(response.url):
+            raise ValueError(
+                "Cookies have expired. Please re-authenticate by running 'notebooklm-mcp-auth'."
+            )
 
-        # Use a temporary client for the page fetch
-        with httpx.Client(headers=headers, follow_redirects=True, timeout=15.0) as client:
-            response = client.get(f"{self.BASE_URL}/")
+        if response.status_code != 200:
+            raise ValueError(f"Failed to fetch NotebookLM page: HTTP {response.status_code}")
 
-            # Check if redirected to login (cookies expired)
-            if "accounts.google.com" in str(response.url):
-                raise ValueError(
-                    "Cookies have expired. Please re-authenticate by running 'notebooklm-mcp-auth'."
-                )
+        html = response.text
 
-            if response.status_code != 200:
-                raise ValueError(f"Failed to fetch NotebookLM page: HTTP {response.status_code}")
-
-            html = response.text
-
-            # Extract CSRF token (SNlM0e)
-            csrf_match = re.search(r'"SNlM0e":"([^"]+)"', html)
-            if not csrf_match:
-                # Save HTML for debugging
-                from pathlib import Path
-                debug_dir = Path.home() / ".notebooklm-mcp"
-                debug_dir.mkdir(exist_ok=True)
-                debug_path = debug_dir / "debug_page.html"
-                debug_path.write_text(html)
-                raise ValueError(
-                    f"Could not extract CSRF token from page. "
-                    f"Page saved to {debug_path} for debugging. "
-                    f"The page structure may have changed."
-                )
+        # Extract CSRF token (SNlM0e)
+        csrf_match = re.search(r'"SNlM0e":"([^"]+)"', html)
+        if not csrf_match:
+            # Save HTML for debugging
+            from pathlib import Path
+            debug_dir = Path.home() / ".notebooklm-mcp"
+            debug_dir.mkdir(exist_ok=True)
+            debug_path = debug_dir / "debug_page.html"
+            debug_path.write_text(html)
+            raise ValueError(
+                f"Could not extract CSRF token from page. "
+                f"Page saved to {debug_path} for debugging. "
+                f"The page structure may have changed."
+            )
 
-            self.csrf_token = csrf_match.group(1)
+        self.csrf_token = csrf_match.group(1)
+        self._auth_stale = False
 
-            # Extract session ID (FdrFJe) - optional but helps
-            sid_match = re.search(r'"FdrFJe":"([^"]+)"', html)
-            if sid_match:
-                self._session_id = sid_match.group(1)
+        # Extract session ID (FdrFJe) - optional but helps
+        sid_match = re.search(r'"FdrFJe":"([^"]+)"', html)
+        if sid_match:
+            self._session_id = sid_match.group(1)
 
-            # Cache the extracted tokens to avoid re-fetching the page on next request
-            self._update_cached_tokens()
+        # Cache the extracted tokens to avoid re-fetching the page on next request
+        self._update_cached_tokens()
 
     def _update_cached_tokens(self) -> None:
         """Update the cached auth tokens with newly extracted CSRF token and session ID.
@@ -323,6 +357,31 @@ class NotebookLMClient:
             # Silently fail - caching is an optimization, not critical
             pass
 
+    def set_tokens(self, cookies: dict[str, str], csrf_token: str = "", session_id: str = "") -> None:
+        """Switch to new auth tokens (possibly another account) in place.
+
+        Keeps the HTTP client and its warm connections; only the Cookie
+        header changes. Missing CSRF token / session ID are fetched from the
+        page on the next request, as after __init__.
+        """
+        self.cookies = cookies
+        self.csrf_token = csrf_token
+        self._session_id = session_id
+        if self._client is not None:
+            self._client.headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+
+        # Full tokens also clear an earlier invalidate_auth()
+        self._auth_stale = not (csrf_token and session_id)
+
+    def invalidate_auth(self) -> None:
+        """Re-extract the CSRF token and session ID before the next request."""
+        self._auth_stale = True
+
+    def _ensure_auth_tokens(self) -> None:
+        """Fetch the CSRF token and session ID if they're missing or invalidated."""
+        if self._auth_stale:
+            self._refresh_auth_tokens()
+
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client."""
         if self._client is None:
@@ -338,22 +397,99 @@ class NotebookLMClient:
                     "X-Same-Domain": "1",
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
                 },
-                timeout=30.0,
+                limits=self.HTTP_LIMITS,
+                timeout=httpx.Timeout(30.0),
+                # Concurrent requests share one multiplexed connection
+                http2=True,
             )
         return self._client
 
+    def _post(self, url: str, body: str, timeout: float | None = None) -> httpx.Response:
+        """POST a request, refreshing auth tokens and retrying once on 401/403.
+
+        The body's CSRF token (at=) and the URL's session ID (f.sid=) are
+        swapped for the refreshed ones before retrying.
+        """
+        client = self._get_client()
+        kwargs = {"timeout": timeout} if timeout else {}
+        response = client.post(url, content=body, **kwargs)
+        if response.status_code not in (401, 403):
+            return response
+
+        url, body = self._reauthorize(url, body)
+        return client.post(url, content=body, **kwargs)
+
+    def _reauthorize(self, url: str, body: str) -> tuple[str, str]:
+        """Refresh auth tokens and swap them into a rejected request's URL and body."""
+        old_csrf, old_session_id = self.csrf_token, self._session_id
+        self._refresh_auth_tokens()
+        if old_csrf:
+            body = body.replace(
+                f"at={urllib.parse.quote(old_csrf, safe='')}",
+                f"at={urllib.parse.quote(self.csrf_token, safe='')}",
+            )
+        if old_session_id:
+            url = url.replace(
+                urllib.parse.urlencode({"f.sid": old_session_id}),
+                urllib.parse.urlencode({"f.sid": self._session_id}),
+            )
+        return url, body
+
+    def _post_streamed(self, url: str, body: str, on_answer: Callable[[str], None]) -> str:
+        """POST a query and report partial answers while the response streams in.
+
+        on_answer is called with the answer so far each time a longer answer
+        chunk arrives. Returns the full response text, like _post().text.
+        A 401/403 is retried once with refreshed tokens, without streaming.
+        """
+        client = self._get_client()
+        lines = []
+        longest_answer = ""
+        with client.stream("POST", url, content=body) as response:
+            rejected = response.status_code in (401, 403)
+            if not rejected:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    lines.append(line)
+                    text, is_answer = self._extract_answer_from_chunk(line)
+                    if text and is_answer and len(text) > len(longest_answer):
+                        longest_answer = text
+                        on_answer(text)
+
+        if rejected:
+            url, body = self._reauthorize(url, body)
+            response = client.post(url, content=body)
+            response.raise_for_status()
+            return response.text
+        return "\n".join(lines)
+
     def _build_request_body(self, rpc_id: str, params: Any) -> str:
         """Build the batchexecute request body."""
+        return self._build_batch_request_body([(rpc_id, params)])
+
+    def _build_batch_request_body(self, calls: list[tuple[str, Any]]) -> str:
+        """Build a batchexecute request body carrying one or more RPC calls.
+
+        A single call is tagged "generic"; in a multi-call batch each call is
+        tagged with its 1-based position, which the response echoes back.
+        """
         # The params need to be JSON-encoded, then wrapped in the RPC structure
         # Use separators to match Chrome's compact format (no spaces)
-        params_json = json.dumps(params, separators=(',', ':'))
-
-        f_req = [[[rpc_id, params_json, None, "generic"]]]
+        f_req = [[
+            [
+                rpc_id,
+                json.dumps(params, separators=(',', ':')),
+                None,
+                "generic" if len(calls) == 1 else str(index),
+            ]
+            for index, (rpc_id, params) in enumerate(calls, start=1)
+        ]]
         f_req_json = json.dumps(f_req, separators=(',', ':'))
 
         # URL encode (safe='' encodes all characters including /)
         body_parts = [f"f.req={urllib.parse.quote(f_req_json, safe='')}"]
 
+        self._ensure_auth_tokens()
         if self.csrf_token:
             body_parts.append(f"at={urllib.parse.quote(self.csrf_token, safe='')}")
 
@@ -438,6 +574,24 @@ class NotebookLMClient:
                             return result_str
         return None
 
+    def _extract_batch_results(self, parsed_response: list, rpc_id: str) -> dict[str, Any]:
+        """Extract the results of a multi-call batch, keyed by call tag ("1", "2", ...)."""
+        results = {}
+        for chunk in parsed_response:
+            if not isinstance(chunk, list):
+                continue
+            for item in chunk:
+                if (isinstance(item, list) and len(item) >= 7
+                        and item[0] == "wrb.fr" and item[1] == rpc_id):
+                    result = item[2]
+                    if isinstance(result, str):
+                        try:
+                            result = json.loads(result)
+                        except json.JSONDecodeError:
+                            pass
+                    results[item[6]] = result
+        return results
+
     def _call_rpc(
         self,
         rpc_id: str,
@@ -446,13 +600,9 @@ class NotebookLMClient:
         timeout: float | None = None,
     ) -> Any:
         """Execute an RPC call and return the extracted result."""
-        client = self._get_client()
         body = self._build_request_body(rpc_id, params)
         url = self._build_url(rpc_id, path)
-        if timeout:
-            response = client.post(url, content=body, timeout=timeout)
-        else:
-            response = client.post(url, content=body)
+        response = self._post(url, body, timeout=timeout)
         response.raise_for_status()
         parsed = self._parse_response(response.text)
         return self._extract_rpc_result(parsed, rpc_id)
@@ -527,8 +677,6 @@ class NotebookLMClient:
 
     def list_notebooks(self, debug: bool = False) -> list[Notebook]:
         """List all notebooks."""
-        client = self._get_client()
-
         # [null, 1, null, [2]] - params for list notebooks
         params = [None, 1, None, [2]]
         body = self._build_request_body(self.RPC_LIST_NOTEBOOKS, params)
@@ -538,7 +686,7 @@ class NotebookLMClient:
             print(f"[DEBUG] URL: {url}")
             print(f"[DEBUG] Body: {body[:200]}...")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         if debug:
@@ -863,13 +1011,11 @@ class NotebookLMClient:
         Returns:
             True on success, False on failure
         """
-        client = self._get_client()
-
         params = [[notebook_id], [2]]
         body = self._build_request_body(self.RPC_DELETE_NOTEBOOK, params)
         url = self._build_url(self.RPC_DELETE_NOTEBOOK)
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -880,36 +1026,67 @@ class NotebookLMClient:
     def check_source_freshness(self, source_id: str) -> bool | None:
         """Check if a Drive source is fresh (up-to-date with Google Drive).
     """
-        client = self._get_client()
-
         params = [None, [source_id], [2]]
         body = self._build_request_body(self.RPC_CHECK_FRESHNESS, params)
         url = self._build_url(self.RPC_CHECK_FRESHNESS)
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
         result = self._extract_rpc_result(parsed, self.RPC_CHECK_FRESHNESS)
+        return self._parse_freshness(result)
+
+    def check_sources_freshness_batch(self, source_ids: list[str]) -> dict[str, bool | None]:
+        """Check freshness of several Drive sources with batchexecute requests.
+
+        Sources are checked FRESHNESS_BATCH_SIZE per request. Each source's
+        sub-response is parsed on its own, so one malformed entry only makes
+        that source unknown.
+
+        Returns:
+            Dict mapping each source ID to True (fresh), False (stale), or
+            None (unknown - missing or malformed in the response)
+        """
+        freshness = {}
+        for start in range(0, len(source_ids), self.FRESHNESS_BATCH_SIZE):
+            chunk = source_ids[start:start + self.FRESHNESS_BATCH_SIZE]
+            calls = [(self.RPC_CHECK_FRESHNESS, [None, [source_id], [2]]) for source_id in chunk]
+            body = self._build_batch_request_body(calls)
+            url = self._build_url(",".join(rpc_id for rpc_id, _ in calls))
+
+            response = self._post(url, body)
+            response.raise_for_status()
+
+            parsed = self._parse_response(response.text)
+            if len(calls) == 1:
+                results = {"1": self._extract_rpc_result(parsed, self.RPC_CHECK_FRESHNESS)}
+            else:
+                results = self._extract_batch_results(parsed, self.RPC_CHECK_FRESHNESS)
+
+            for index, source_id in enumerate(chunk, start=1):
+                freshness[source_id] = self._parse_freshness(results.get(str(index)))
+
+        return freshness
 
-        # true = fresh, false = stale
+    @staticmethod
+    def _parse_freshness(result: Any) -> bool | None:
+        """Parse a freshness RPC result: true = fresh, false = stale."""
         if result and isinstance(result, list) and len(result) > 0:
             inner = result[0] if result else []
-            if isinstance(inner, list) and len(inner) >= 2:
+            if isinstance(inner, list) and len(inner) >= 2 and isinstance(inner[1], bool):
                 return inner[1]  # true = fresh, false = stale
         return None
 
     def sync_drive_source(self, source_id: str) -> dict | None:
         """Sync a Drive source with the latest content from Google Drive.
     """
-        client = self._get_client()
-
         # Sync params: [null, ["source_id"], [2]]
         params = [None, [source_id], [2]]
         body = self._build_request_body(self.RPC_SYNC_DRIVE, params)
         url = self._build_url(self.RPC_SYNC_DRIVE)
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -949,15 +1126,13 @@ class NotebookLMClient:
         Returns:
             True on success, False on failure
         """
-        client = self._get_client()
-
         # Delete source params: [[["source_id"]], [2]]
         # Note: Extra nesting compared to delete_notebook
         params = [[[source_id]], [2]]
         body = self._build_request_body(self.RPC_DELETE_SOURCE, params)
         url = self._build_url(self.RPC_DELETE_SOURCE)
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1030,8 +1205,6 @@ class NotebookLMClient:
     def add_url_source(self, notebook_id: str, url: str) -> dict | None:
         """Add a URL (website or YouTube) as a source to a notebook.
     """
-        client = self._get_client()
-
         # URL position differs for YouTube vs regular websites:
         # - YouTube: position 7
         # - Regular websites: position 2
@@ -1054,7 +1227,7 @@ class NotebookLMClient:
         source_path = f"/notebook/{notebook_id}"
         url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
 
-        response = client.post(url_endpoint, content=body)
+        response = self._post(url_endpoint, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1072,8 +1245,6 @@ class NotebookLMClient:
     def add_text_source(self, notebook_id: str, text: str, title: str = "Pasted Text") -> dict | None:
         """Add pasted text as a source to a notebook.
     """
-        client = self._get_client()
-
         # Text source params structure:
         source_data = [None, [title, text], None, 2, None, None, None, None, None, None, 1]
         params = [
@@ -1086,7 +1257,7 @@ class NotebookLMClient:
         source_path = f"/notebook/{notebook_id}"
         url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
 
-        response = client.post(url_endpoint, content=body)
+        response = self._post(url_endpoint, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1110,8 +1281,6 @@ class NotebookLMClient:
     ) -> dict | None:
         """Add a Google Drive document as a source to a notebook.
     """
-        client = self._get_client()
-
         # Drive source params structure (verified from network capture):
         source_data = [
             [document_id, mime_type, 1, title],  # Drive document info at position 0
@@ -1136,7 +1305,7 @@ class NotebookLMClient:
         source_path = f"/notebook/{notebook_id}"
         url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
 
-        response = client.post(url_endpoint, content=body)
+        response = self._post(url_endpoint, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1157,6 +1326,7 @@ class NotebookLMClient:
         query_text: str,
         source_ids: list[str] | None = None,
         conversation_id: str | None = None,
+        on_answer: Callable[[str], None] | None = None,
     ) -> dict | None:
         """Query the notebook with a question.
 
@@ -1170,6 +1340,8 @@ class NotebookLMClient:
             conversation_id: Optional conversation ID for follow-up questions.
                            If None, starts a new conversation.
                            If provided and exists in cache, includes conversation history.
+            on_answer: Optional callback for the partial answer as it streams
+                       in (called from this thread with the answer so far)
 
         Returns:
             Dict with:
@@ -1181,8 +1353,6 @@ class NotebookLMClient:
         """
         import uuid
 
-        client = self._get_client()
-
         # If no source_ids provided, get them from the notebook
         if source_ids is None:
             notebook_data = self.get_notebook(notebook_id)
@@ -1219,6 +1389,7 @@ class NotebookLMClient:
 
         # URL encode with safe='' to encode all characters including /
         body_parts = [f"f.req={urllib.parse.quote(f_req_json, safe='')}"]
+        self._ensure_auth_tokens()
         if self.csrf_token:
             body_parts.append(f"at={urllib.parse.quote(self.csrf_token, safe='')}")
         # Add trailing & to match NotebookLM's format
@@ -1237,11 +1408,15 @@ class NotebookLMClient:
         query_string = urllib.parse.urlencode(url_params)
         url = f"{self.BASE_URL}{self.QUERY_ENDPOINT}?{query_string}"
 
-        response = client.post(url, content=body)
-        response.raise_for_status()
+        if on_answer is None:
+            response = self._post(url, body)
+            response.raise_for_status()
+            response_text = response.text
+        else:
+            response_text = self._post_streamed(url, body, on_answer)
 
         # Parse streaming response
-        answer_text = self._parse_query_response(response.text)
+        answer_text = self._parse_query_response(response_text)
 
         # Cache this turn for future follow-ups (only if we got an answer)
         if answer_text:
@@ -1256,7 +1431,7 @@ class NotebookLMClient:
             "conversation_id": conversation_id,
             "turn_number": turn_number,
             "is_follow_up": not is_new_conversation,
-            "raw_response": response.text[:1000] if response.text else "",  # Truncate for debugging
+            "raw_response": response_text[:1000],  # Truncate for debugging
         }
 
     def _extract_source_ids_from_notebook(self, notebook_data: Any) -> list[str]:
@@ -1435,8 +1610,6 @@ class NotebookLMClient:
         # Map to internal constants
         source_type = self.RESEARCH_SOURCE_WEB if source_lower == "web" else self.RESEARCH_SOURCE_DRIVE
 
-        client = self._get_client()
-
         if mode_lower == "fast":
             # Fast Research: Ljjv0c
             params = [[query, source_type], None, 1, notebook_id]
@@ -1449,7 +1622,7 @@ class NotebookLMClient:
         body = self._build_request_body(rpc_id, params)
         url = self._build_url(rpc_id, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1480,14 +1653,12 @@ class NotebookLMClient:
         Returns:
             Dict with status, sources, and summary when complete
         """
-        client = self._get_client()
-
         # Poll params: [null, null, "notebook_id"]
         params = [None, None, notebook_id]
         body = self._build_request_body(self.RPC_POLL_RESEARCH, params)
         url = self._build_url(self.RPC_POLL_RESEARCH, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1626,8 +1797,6 @@ class NotebookLMClient:
         if not sources:
             return []
 
-        client = self._get_client()
-
         # Build source array for import
         # Web source: [null, null, ["url", "title"], null, null, null, null, null, null, null, 2]
         # Drive source: Extract doc_id from URL and use different structure
@@ -1655,12 +1824,9 @@ class NotebookLMClient:
 
                 if doc_id:
                     # Determine MIME type from result_type
-                    mime_types = {
-                        2: "application/vnd.google-apps.document",
-                        3: "application/vnd.google-apps.presentation",
-                        8: "application/vnd.google-apps.spreadsheet",
-                    }
-                    mime_type = mime_types.get(result_type, "application/vnd.google-apps.document")
+                    mime_type = self.RESULT_TYPE_MIME_TYPES.get(
+                        result_type, "application/vnd.google-apps.document"
+                    )
                     # Drive source structure: [[doc_id, mime_type, 1, title], null x9, 2]
                     # The 1 at position 2 and trailing 2 are required for Drive sources
                     source_data = [[doc_id, mime_type, 1, title], None, None, None, None, None, None, None, None, None, 2]
@@ -1677,7 +1843,7 @@ class NotebookLMClient:
 
         # Import can take a long time when fetching multiple web sources
         # Use 120s timeout instead of the default 30s
-        response = client.post(url, content=body, timeout=120.0)
+        response = self._post(url, body, timeout=120.0)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1712,11 +1878,9 @@ class NotebookLMClient:
         length_code: int = 2,  # AUDIO_LENGTH_DEFAULT
         language: str = "en",
         focus_prompt: str = "",
-    ) -> dict | None:
+    ) -> dict:
         """Create an Audio Overview (podcast) for a notebook.
     """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -1751,7 +1915,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1772,7 +1936,7 @@ class NotebookLMClient:
                 "language": language,
             }
 
-        return None
+        raise CreateArtifactError("audio overview")
 
     def create_video_overview(
         self,
@@ -1782,11 +1946,9 @@ class NotebookLMClient:
         visual_style_code: int = 1,  # VIDEO_STYLE_AUTO_SELECT
         language: str = "en",
         focus_prompt: str = "",
-    ) -> dict | None:
+    ) -> dict:
         """Create a Video Overview for a notebook.
     """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -1820,7 +1982,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1841,19 +2003,17 @@ class NotebookLMClient:
                 "language": language,
             }
 
-        return None
+        raise CreateArtifactError("video overview")
 
     def poll_studio_status(self, notebook_id: str) -> list[dict]:
         """Poll for studio content (audio/video overviews) status.
     """
-        client = self._get_client()
-
         # Poll params: [[2], notebook_id, 'NOT artifact.status = "ARTIFACT_STATUS_SUGGESTED"']
         params = [[2], notebook_id, 'NOT artifact.status = "ARTIFACT_STATUS_SUGGESTED"']
         body = self._build_request_body(self.RPC_POLL_STUDIO, params)
         url = self._build_url(self.RPC_POLL_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -1995,14 +2155,12 @@ class NotebookLMClient:
         Returns:
             True on success, False on failure
         """
-        client = self._get_client()
-
         # Delete studio artifact params: [[2], "artifact_id"]
         params = [[2], artifact_id]
         body = self._build_request_body(self.RPC_DELETE_STUDIO, params)
         url = self._build_url(self.RPC_DELETE_STUDIO)
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2018,11 +2176,9 @@ class NotebookLMClient:
         detail_level_code: int = 2,  # INFOGRAPHIC_DETAIL_STANDARD
         language: str = "en",
         focus_prompt: str = "",
-    ) -> dict | None:
+    ) -> dict:
         """Create an Infographic from notebook sources.
     """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -2047,7 +2203,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2068,7 +2224,7 @@ class NotebookLMClient:
                 "language": language,
             }
 
-        return None
+        raise CreateArtifactError("infographic")
 
     def create_slide_deck(
         self,
@@ -2078,11 +2234,9 @@ class NotebookLMClient:
         length_code: int = 3,  # SLIDE_DECK_LENGTH_DEFAULT
         language: str = "en",
         focus_prompt: str = "",
-    ) -> dict | None:
+    ) -> dict:
         """Create a Slide Deck from notebook sources.
     """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -2106,7 +2260,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2127,7 +2281,7 @@ class NotebookLMClient:
                 "language": language,
             }
 
-        return None
+        raise CreateArtifactError("slide deck")
 
     def create_report(
         self,
@@ -2136,11 +2290,9 @@ class NotebookLMClient:
         report_format: str = "Briefing Doc",
         custom_prompt: str = "",
         language: str = "en",
-    ) -> dict | None:
+    ) -> dict:
         """Create a Report from notebook sources.
     """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -2224,7 +2376,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2244,7 +2396,7 @@ class NotebookLMClient:
                 "language": language,
             }
 
-        return None
+        raise CreateArtifactError("report")
 
     def create_flashcards(
         self,
@@ -2252,11 +2404,9 @@ class NotebookLMClient:
         source_ids: list[str],
         difficulty: str = "medium",
         card_count: str = "default",
-    ) -> dict | None:
+    ) -> dict:
         """Create Flashcards from notebook sources.
     """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -2300,7 +2450,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2319,7 +2469,7 @@ class NotebookLMClient:
                 "difficulty": difficulty.lower(),
             }
 
-        return None
+        raise CreateArtifactError("flashcards")
 
     def create_quiz(
         self,
@@ -2327,7 +2477,7 @@ class NotebookLMClient:
         source_ids: list[str],
         question_count: int = 2,
         difficulty: int = 2,
-    ) -> dict | None:
+    ) -> dict:
         """Create Quiz from notebook sources.
 
         Args:
@@ -2336,7 +2486,6 @@ class NotebookLMClient:
             question_count: Number of questions (default: 2)
             difficulty: Difficulty level (default: 2)
         """
-        client = self._get_client()
         sources_nested = [[[sid]] for sid in source_ids]
 
         # Quiz options at position 9: [null, [2, null*6, [question_count, difficulty]]]
@@ -2362,7 +2511,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2382,7 +2531,7 @@ class NotebookLMClient:
                 "difficulty": difficulty,
             }
 
-        return None
+        raise CreateArtifactError("quiz")
 
     def create_data_table(
         self,
@@ -2390,7 +2539,7 @@ class NotebookLMClient:
         source_ids: list[str],
         description: str,
         language: str = "en",
-    ) -> dict | None:
+    ) -> dict:
         """Create Data Table from notebook sources.
 
         Args:
@@ -2399,7 +2548,6 @@ class NotebookLMClient:
             description: Description of the data table to create
             language: Language code (default: "en")
         """
-        client = self._get_client()
         sources_nested = [[[sid]] for sid in source_ids]
 
         # Data Table options at position 18: [null, [description, language]]
@@ -2418,7 +2566,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_CREATE_STUDIO, params)
         url = self._build_url(self.RPC_CREATE_STUDIO, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2437,7 +2585,7 @@ class NotebookLMClient:
                 "description": description,
             }
 
-        return None
+        raise CreateArtifactError("data table")
 
     def generate_mind_map(
         self,
@@ -2454,8 +2602,6 @@ class NotebookLMClient:
         Returns:
             Dict with mind_map_json and generation_id, or None on failure
         """
-        client = self._get_client()
-
         # Build source IDs in the nested format: [[[id1]], [[id2]], ...]
         sources_nested = [[[sid]] for sid in source_ids]
 
@@ -2470,7 +2616,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_GENERATE_MIND_MAP, params)
         url = self._build_url(self.RPC_GENERATE_MIND_MAP)
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2517,8 +2663,6 @@ class NotebookLMClient:
         Returns:
             Dict with mind_map_id and saved info, or None on failure
         """
-        client = self._get_client()
-
         # Build source IDs in the simpler format: [[id1], [id2], ...]
         sources_simple = [[sid] for sid in source_ids]
 
@@ -2535,7 +2679,7 @@ class NotebookLMClient:
         body = self._build_request_body(self.RPC_SAVE_MIND_MAP, params)
         url = self._build_url(self.RPC_SAVE_MIND_MAP, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2561,14 +2705,12 @@ class NotebookLMClient:
     def list_mind_maps(self, notebook_id: str) -> list[dict]:
         """List all Mind Maps in a notebook.
     """
-        client = self._get_client()
-
         params = [notebook_id]
 
         body = self._build_request_body(self.RPC_LIST_MIND_MAPS, params)
         url = self._build_url(self.RPC_LIST_MIND_MAPS, f"/notebook/{notebook_id}")
 
-        response = client.post(url, content=body)
+        response = self._post(url, body)
         response.raise_for_status()
 
         parsed = self._parse_response(response.text)
@@ -2697,10 +2839,18 @@ class NotebookLMClient:
             self._client = None
 
 
-def extract_cookies_from_chrome_export(cookie_header: str) -> dict[str, str]:
+# One "name=value" pair of a Cookie header, without surrounding whitespace
+_COOKIE_RE = re.compile(r"\s*([^=;\s]+)\s*=\s*([^;]*?)\s*(?:;|$)")
+
+
+def extract_cookies_from_chrome_export(
+    cookie_header: str, names: frozenset[str] | None = None
+) -> dict[str, str]:
     """
     Extract cookies from a copy-pasted cookie header value.
 
+    If names is given, only those cookies are kept (filtered while parsing).
+
     Usage:
     1. Go to notebooklm.google.com in Chrome
     2. Open DevTools > Network tab
@@ -2708,13 +2858,9 @@ def extract_cookies_from_chrome_export(cookie_header: str) -> dict[str, str]:
     4. Copy the Cookie header value
     5. Pass it to this function
     """
-    cookies = {}
-    for part in cookie_header.split(";"):
-        part = part.strip()
-        if "=" in part:
-            key, value = part.split("=", 1)
-            cookies[key.strip()] = value.strip()
-    return cookies
+    if names is None:
+        return dict(_COOKIE_RE.findall(cookie_header))
+    return {name: value for name, value in _COOKIE_RE.findall(cookie_header) if name in names}
 
 
 # Example usage (for testing)
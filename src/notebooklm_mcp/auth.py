@@ -114,6 +114,54 @@ def save_tokens_to_cache(tokens: AuthTokens, silent: bool = False) -> None:
         print(f"Auth tokens cached to {cache_path}")
 
 
+CDP_CACHE_TTL = 3600  # Reuse the last DevTools page for up to an hour
+
+
+def _get_cdp_cache_path() -> Path:
+    """Get the path to the DevTools page cache file."""
+    return get_cache_path().with_name("cdp.json")
+
+
+def _load_cached_cdp(port: int) -> dict | None:
+    """Load the DevTools page used by the last auth run, if it is still open.
+
+    Returns a page dict with "id" and "webSocketDebuggerUrl", or None if
+    there is no fresh cache entry for this port or the page has gone away.
+    """
+    from urllib.parse import urlparse
+
+    cache_path = _get_cdp_cache_path()
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+        ws_url = data["ws"]
+        if time.time() - data["ts"] > CDP_CACHE_TTL or urlparse(ws_url).port != port:
+            return None
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+    # Chrome may have been closed or the tab replaced since the last run
+    import websocket
+
+    try:
+        websocket.create_connection(ws_url, timeout=1).close()
+    except Exception:
+        cache_path.unlink(missing_ok=True)
+        return None
+
+    return {"id": data.get("page_id"), "webSocketDebuggerUrl": ws_url}
+
+
+def _save_cached_cdp(page: dict) -> None:
+    """Remember the DevTools page so the next auth run can skip discovery."""
+    ws_url = page.get("webSocketDebuggerUrl")
+    if not ws_url:
+        return
+
+    with open(_get_cdp_cache_path(), "w") as f:
+        json.dump({"ws": ws_url, "page_id": page.get("id"), "ts": time.time()}, f, indent=2)
+
+
 def extract_tokens_via_chrome_devtools() -> AuthTokens | None:
     """
     Extract auth tokens using Chrome DevTools.
@@ -141,45 +189,6 @@ def extract_tokens_via_chrome_devtools() -> AuthTokens | None:
     )
 
 
-def extract_csrf_from_page_source(html: str) -> str | None:
-    """Extract CSRF token from page HTML.
-
-    The token is stored in WIZ_global_data.SNlM0e or similar structures.
-    """
-    import re
-
-    # Try different patterns for CSRF token
-    patterns = [
-        r'"SNlM0e":"([^"]+)"',  # WIZ_global_data.SNlM0e
-        r'at=([^&"]+)',  # Direct at= value
-        r'"FdrFJe":"([^"]+)"',  # Alternative location
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, html)
-        if match:
-            return match.group(1)
-
-    return None
-
-
-def extract_session_id_from_page(html: str) -> str | None:
-    """Extract session ID from page HTML."""
-    import re
-
-    patterns = [
-        r'"FdrFJe":"([^"]+)"',
-        r'f\.sid=(\d+)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, html)
-        if match:
-            return match.group(1)
-
-    return None
-
-
 # ============================================================================
 # CLI Authentication Flow
 # ============================================================================
@@ -212,12 +221,20 @@ def parse_cookies_from_chrome_format(cookies_list: list[dict]) -> dict[str, str]
 
 
 # Tokens that need to be present for auth to work
-REQUIRED_COOKIES = ["SID", "HSID", "SSID", "APISID", "SAPISID"]
+REQUIRED_COOKIES: frozenset[str] = frozenset({"SID", "HSID", "SSID", "APISID", "SAPISID"})
+
+# Essential cookies for NotebookLM API authentication
+# Only these are needed - no need to save all 20+ cookies from the browser
+ESSENTIAL_COOKIES: frozenset[str] = frozenset({
+    "SID", "HSID", "SSID", "APISID", "SAPISID",  # Core auth cookies
+    "__Secure-1PSID", "__Secure-3PSID",  # Secure session variants
+    "__Secure-1PAPISID", "__Secure-3PAPISID",  # Secure API variants
+    "OSID", "__Secure-OSID",  # Origin-bound session
+    "__Secure-1PSIDTS", "__Secure-3PSIDTS",  # Timestamp tokens (rotate frequently)
+    "SIDCC", "__Secure-1PSIDCC", "__Secure-3PSIDCC",  # Session cookies (rotate frequently)
+})
 
 
 def validate_cookies(cookies: dict[str, str]) -> bool:
     """Check if required cookies are present."""
-    for required in REQUIRED_COOKIES:
-        if required not in cookies:
-            return False
-    return True
+    return REQUIRED_COOKIES <= cookies.keys()
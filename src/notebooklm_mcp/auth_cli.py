@@ -19,43 +19,75 @@ Usage:
     5. Tokens are cached to ~/.notebooklm-mcp/auth.json
 """
 
+import base64
 import json
+import platform
 import re
+import shutil
+import socket
+import subprocess
 import sys
 import time
+from collections import deque
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
+import orjson
 
 from .auth import (
     AuthTokens,
+    ESSENTIAL_COOKIES,
     REQUIRED_COOKIES,
-    extract_csrf_from_page_source,
+    _load_cached_cdp,
+    _save_cached_cdp,
     get_cache_path,
     save_tokens_to_cache,
-    validate_cookies,
 )
 
 
+if TYPE_CHECKING:
+    import httpx  # Imported lazily - only the Chrome discovery path needs it
+
+
 CDP_DEFAULT_PORT = 9222
 NOTEBOOKLM_URL = "https://notebooklm.google.com/"
 
+# Only the cookies NotebookLM requests carry
+_COOKIE_URLS = [NOTEBOOKLM_URL]
+
+# Pooled client for the DevTools HTTP endpoint, reused across discovery calls
+_client: "httpx.Client | None" = None
+_client_port: int | None = None
 
-def get_chrome_user_data_dir() -> str | None:
-    """Get the default Chrome user data directory."""
-    import platform
-    from pathlib import Path
 
-    system = platform.system()
-    home = Path.home()
+# Platform details never change within a process - resolve them once
+_SYSTEM = platform.system()
+_HOME = Path.home()
 
-    if system == "Darwin":
-        return str(home / "Library/Application Support/Google/Chrome")
-    elif system == "Linux":
-        return str(home / ".config/google-chrome")
-    elif system == "Windows":
-        return str(home / "AppData/Local/Google/Chrome/User Data")
-    return None
+# Chrome binary names vary by Linux distro - the first one on PATH is used
+_LINUX_CHROME_CANDIDATES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+if _SYSTEM == "Linux":
+    _CHROME_BIN = next((c for c in _LINUX_CHROME_CANDIDATES if shutil.which(c)), None)
+else:
+    _CHROME_BIN = {
+        "Darwin": "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "Windows": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    }.get(_SYSTEM)
+
+_USER_DATA_DIR = {
+    "Darwin": _HOME / "Library/Application Support/Google/Chrome",
+    "Linux": _HOME / ".config/google-chrome",
+    "Windows": _HOME / "AppData/Local/Google/Chrome/User Data",
+}.get(_SYSTEM)
+
+# Our own Chrome profile, separate from the user's main one
+_PROFILE_DIR = _HOME / ".notebooklm-mcp" / "chrome-profile"
+
+
+def get_chrome_user_data_dir() -> str | None:
+    """Get the default Chrome user data directory."""
+    return str(_USER_DATA_DIR) if _USER_DATA_DIR else None
 
 
 def launch_chrome(port: int, headless: bool = False) -> bool:
@@ -68,43 +100,24 @@ def launch_chrome(port: int, headless: bool = False) -> bool:
     Returns:
         True if Chrome was launched, False if failed
     """
-    import platform
-    import subprocess
-
-    system = platform.system()
-
-    if system == "Darwin":
-        chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-    elif system == "Linux":
-        # Try multiple Chrome binary names (varies by distro)
-        import shutil
-        chrome_candidates = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
-        chrome_path = None
-        for candidate in chrome_candidates:
-            if shutil.which(candidate):
-                chrome_path = candidate
-                break
-        if not chrome_path:
-            print(f"Chrome not found. Tried: {', '.join(chrome_candidates)}")
-            return False
-    elif system == "Windows":
-        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-    else:
-        print(f"Unsupported platform: {system}")
+    if not _CHROME_BIN:
+        if _SYSTEM == "Linux":
+            print(f"Chrome not found. Tried: {', '.join(_LINUX_CHROME_CANDIDATES)}")
+        else:
+            print(f"Unsupported platform: {_SYSTEM}")
         return False
 
     # Chrome 136+ requires a non-default user-data-dir for remote debugging
     # We use a persistent directory so Google login is remembered across runs
-    profile_dir = Path.home() / ".notebooklm-mcp" / "chrome-profile"
-    profile_dir.mkdir(parents=True, exist_ok=True)
+    _PROFILE_DIR.mkdir(parents=True, exist_ok=True)
 
     args = [
-        chrome_path,
+        _CHROME_BIN,
         f"--remote-debugging-port={port}",
         "--no-first-run",
         "--no-default-browser-check",
         "--disable-extensions",  # Bypass extensions that may interfere (e.g., Antigravity IDE)
-        f"--user-data-dir={profile_dir}",  # Persistent profile for login persistence
+        f"--user-data-dir={_PROFILE_DIR}",  # Persistent profile for login persistence
         "--remote-allow-origins=*",  # Allow WebSocket connections from any origin
     ]
 
@@ -115,7 +128,13 @@ def launch_chrome(port: int, headless: bool = False) -> bool:
         # Print the command for debugging
         print(f"Running: {' '.join(args[:3])}...")
         process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        time.sleep(3)  # Wait for Chrome to start
+
+        # Wait for the debugger to come up rather than a fixed delay
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and process.poll() is None:
+            if get_chrome_debugger_url(port):
+                break
+            time.sleep(0.1)
 
         # Check if there was an immediate error
         if process.poll() is not None:
@@ -128,10 +147,37 @@ def launch_chrome(port: int, headless: bool = False) -> bool:
         return False
 
 
+def _get_client(port: int) -> "httpx.Client":
+    """Get the pooled HTTP client for the DevTools endpoint on the given port.
+
+    Chrome's debugger only speaks HTTP/1.1, so the win here is keep-alive:
+    discovery calls share one connection instead of a handshake each.
+    """
+    global _client, _client_port
+
+    if _client is None or _client_port != port:
+        import httpx
+
+        _close_client()
+        _client = httpx.Client(base_url=f"http://localhost:{port}", timeout=5)
+        _client_port = port
+    return _client
+
+
+def _close_client() -> None:
+    """Close the pooled DevTools HTTP client, if any."""
+    global _client, _client_port
+
+    if _client is not None:
+        _client.close()
+    _client = None
+    _client_port = None
+
+
 def get_chrome_debugger_url(port: int = CDP_DEFAULT_PORT) -> str | None:
     """Get the WebSocket debugger URL for Chrome."""
     try:
-        response = httpx.get(f"http://localhost:{port}/json/version", timeout=5)
+        response = _get_client(port).get("/json/version")
         data = response.json()
         return data.get("webSocketDebuggerUrl")
     except Exception:
@@ -141,14 +187,20 @@ def get_chrome_debugger_url(port: int = CDP_DEFAULT_PORT) -> str | None:
 def get_chrome_pages(port: int = CDP_DEFAULT_PORT) -> list[dict]:
     """Get list of open pages in Chrome."""
     try:
-        response = httpx.get(f"http://localhost:{port}/json", timeout=5)
+        response = _get_client(port).get("/json")
         return response.json()
     except Exception:
         return []
 
 
-def find_or_create_notebooklm_page(port: int = CDP_DEFAULT_PORT) -> dict | None:
-    """Find an existing NotebookLM page or create a new one."""
+def find_or_create_notebooklm_page(port: int = CDP_DEFAULT_PORT) -> tuple[dict | None, bool]:
+    """Find an existing NotebookLM page or create a new one.
+
+    Returns:
+        Tuple of (page, already_on_notebooklm). The flag is True when the
+        page is known to be on (or loading) NotebookLM, so the caller
+        doesn't need to navigate it again.
+    """
     from urllib.parse import quote
 
     pages = get_chrome_pages(port)
@@ -157,95 +209,298 @@ def find_or_create_notebooklm_page(port: int = CDP_DEFAULT_PORT) -> dict | None:
     for page in pages:
         url = page.get("url", "")
         if "notebooklm.google.com" in url:
-            return page
+            return page, True
 
     # Create a new page - URL must be properly encoded
     try:
         encoded_url = quote(NOTEBOOKLM_URL, safe="")
-        response = httpx.put(
-            f"http://localhost:{port}/json/new?{encoded_url}",
-            timeout=15
-        )
+        response = _get_client(port).put(f"/json/new?{encoded_url}", timeout=15)
         if response.status_code == 200 and response.text.strip():
-            return response.json()
+            return response.json(), True
 
         # Fallback: create blank page then navigate
-        response = httpx.put(f"http://localhost:{port}/json/new", timeout=10)
+        response = _get_client(port).put("/json/new", timeout=10)
         if response.status_code == 200 and response.text.strip():
             page = response.json()
             # Navigate to NotebookLM using the page's websocket
             ws_url = page.get("webSocketDebuggerUrl")
             if ws_url:
-                navigate_to_url(ws_url, NOTEBOOKLM_URL)
-            return page
+                with CDPSession(ws_url) as session:
+                    navigate_to_url(session, NOTEBOOKLM_URL)
+            return page, bool(ws_url)
 
         print(f"Failed to create page: status={response.status_code}")
-        return None
+        return None, False
     except Exception as e:
         print(f"Failed to create new page: {e}")
-        return None
+        return None, False
+
+
+class CDPSession:
+    """A persistent CDP WebSocket connection to a single page.
+
+    One connection is kept open for the whole auth flow, so commands don't pay
+    a new WebSocket handshake each and domain events (Page.*) can be received
+    on the same socket that subscribed to them.
+
+    Events that arrive while a command waits for its result are buffered and
+    returned by recv_event, so they aren't lost.
+    """
+
+    def __init__(self, ws_url: str, timeout: float = 30):
+        import websocket
+
+        self.timeout = timeout
+        self.ws = websocket.create_connection(ws_url, timeout=timeout)
+        self._next_id = 0
+        self._events: deque[dict] = deque(maxlen=1000)
 
+    def __enter__(self) -> "CDPSession":
+        return self
 
-def execute_cdp_command(ws_url: str, method: str, params: dict = None) -> dict:
-    """Execute a CDP command via WebSocket."""
-    import websocket
+    def __exit__(self, *exc) -> None:
+        self.close()
 
-    ws = websocket.create_connection(ws_url, timeout=30)
+    def send(self, method: str, params: dict | None = None) -> dict:
+        """Send a CDP command and wait for its result.
+
+        Events that arrive before the result are buffered for recv_event.
+        """
+        return self.send_many([(method, params)])[0]
+
+    def send_many(self, commands: list[tuple[str, dict | None]]) -> list[dict]:
+        """Send several CDP commands at once and wait for all their results.
+
+        The commands are pipelined - all are written before any response is
+        read - and responses are matched back by id, so the batch costs a
+        single round-trip. Events that arrive meanwhile are buffered for
+        recv_event.
+
+        Returns:
+            The results, in the same order as commands
+        """
+        pending = {}
+        for method, params in commands:
+            self._next_id += 1
+            pending[self._next_id] = None
+            command = {
+                "id": self._next_id,
+                "method": method,
+                "params": params or {}
+            }
+            self.ws.send(orjson.dumps(command).decode())
+
+        # Wait for responses
+        remaining = len(pending)
+        while remaining:
+            response = orjson.loads(self.ws.recv())
+            command_id = response.get("id")
+            if command_id in pending and pending[command_id] is None:
+                pending[command_id] = response.get("result", {})
+                remaining -= 1
+            elif "method" in response:
+                self._events.append(response)
+
+        return list(pending.values())
+
+    def recv_event(self, timeout: float) -> dict:
+        """Wait for the next message from the page.
+
+        Events buffered while waiting on command results come first.
+
+        Raises:
+            TimeoutError: If nothing arrives within timeout seconds
+        """
+        import websocket
+
+        if self._events:
+            return self._events.popleft()
+
+        self.ws.settimeout(timeout)
+        try:
+            return orjson.loads(self.ws.recv())
+        except websocket.WebSocketTimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        finally:
+            self.ws.settimeout(self.timeout)
+
+    def discard_events(self) -> None:
+        """Drop buffered events, e.g. before a command whose events are awaited."""
+        self._events.clear()
+
+    def close(self) -> None:
+        self.ws.close()
+
+
+def get_page_cookies(session: CDPSession) -> list[dict]:
+    """Get the cookies sent to NotebookLM."""
+    result = session.send("Network.getCookies", {"urls": _COOKIE_URLS})
+    return result.get("cookies", [])
+
+
+def get_document_body(session: CDPSession, timeout: float = 15) -> str:
+    """Reload the page and return the raw HTML of its main document response.
+
+    Uses Network.responseReceived to find the NotebookLM document request and
+    Network.getResponseBody to read it once loaded - the server's response
+    rather than the hydrated DOM.
+
+    Returns:
+        The response body, or "" if it wasn't captured within timeout seconds
+    """
+    session.send("Network.enable")
     try:
-        command = {
-            "id": 1,
-            "method": method,
-            "params": params or {}
-        }
-        ws.send(json.dumps(command))
-
-        # Wait for response
-        while True:
-            response = json.loads(ws.recv())
-            if response.get("id") == 1:
-                return response.get("result", {})
+        # Events from before the reload can't be the new document's - but ones
+        # arriving before the reload's reply are buffered and seen below
+        session.discard_events()
+        session.send("Page.reload")
+
+        request_id = None
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            event = session.recv_event(timeout=remaining)
+            method = event.get("method")
+            params = event.get("params", {})
+
+            if method == "Network.responseReceived" and request_id is None:
+                url = params.get("response", {}).get("url", "")
+                if params.get("type") == "Document" and "notebooklm.google.com" in url:
+                    request_id = params.get("requestId")
+            elif method == "Network.loadingFinished" and request_id and params.get("requestId") == request_id:
+                result = session.send("Network.getResponseBody", {"requestId": request_id})
+                body = result.get("body", "")
+                if result.get("base64Encoded"):
+                    body = base64.b64decode(body).decode("utf-8", errors="replace")
+                return body
+    except TimeoutError:
+        pass
     finally:
-        ws.close()
+        session.send("Network.disable")
 
+    return ""
 
-def get_page_cookies(ws_url: str) -> list[dict]:
-    """Get all cookies for the page."""
-    result = execute_cdp_command(ws_url, "Network.getCookies")
-    return result.get("cookies", [])
 
+def navigate_to_url(session: CDPSession, url: str, timeout: float = 10) -> None:
+    """Navigate the page to a URL and wait for it to load.
 
-def get_page_html(ws_url: str) -> str:
-    """Get the page HTML to extract CSRF token."""
-    # Enable Runtime domain
-    execute_cdp_command(ws_url, "Runtime.enable")
+    Returns on Page.loadEventFired, or after timeout seconds if the load
+    event never arrives.
+    """
+    session.send("Page.enable")
+    session.discard_events()  # A stale load event must not end the wait early
+    session.send("Page.navigate", {"url": url})
+    wait_for_load(session, timeout)
+
+
+def wait_for_load(session: CDPSession, timeout: float = 10) -> None:
+    """Wait for the current navigation's Page.loadEventFired.
+
+    Page events must be enabled. Returns after timeout seconds if the load
+    event never arrives.
+    """
+    deadline = time.monotonic() + timeout
+    while (remaining := deadline - time.monotonic()) > 0:
+        try:
+            event = session.recv_event(timeout=remaining)
+        except TimeoutError:
+            return
+        if event.get("method") == "Page.loadEventFired":
+            return
+
+
+# Everything the auth flow needs from the page, serialized in one evaluation.
+# The token regexes run in the page (same patterns and priority as
+# extract_auth_tokens) so only the matches cross the WebSocket, not the whole DOM.
+_PAGE_STATE_JS = r"""(() => {
+  const html = document.documentElement.outerHTML;
+  const first = (...patterns) => {
+    for (const re of patterns) {
+      const m = html.match(re);
+      if (m) return m[1];
+    }
+    return "";
+  };
+  return JSON.stringify({
+    url: location.href,
+    ready: document.readyState,
+    csrf: first(/"SNlM0e":"([^"]+)"/, /at=([^&"]+)/, /"FdrFJe":"([^"]+)"/),
+    sid: first(/"FdrFJe":"(\d+)"/, /f\.sid["\s:=]+["']?(\d+)/, /"cfb2h":"([^"]+)"/),
+  });
+})()"""
+
+
+def _parse_page_state(result: dict) -> dict:
+    """Decode the Runtime.evaluate result of _PAGE_STATE_JS."""
+    value = result.get("result", {}).get("value")
+    if not value:
+        return {"url": "", "ready": "", "csrf": "", "sid": ""}
+    return orjson.loads(value)
+
+
+def get_page_state(session: CDPSession) -> dict:
+    """Get the page URL, ready state and auth tokens in a single round-trip.
 
-    # Execute JavaScript to get page HTML
-    result = execute_cdp_command(
-        ws_url,
+    Returns:
+        Dict with url, ready (document.readyState), csrf and sid
+        (empty strings where a token wasn't found)
+    """
+    result = session.send(
         "Runtime.evaluate",
-        {"expression": "document.documentElement.outerHTML"}
+        {"expression": _PAGE_STATE_JS, "returnByValue": True}
     )
+    return _parse_page_state(result)
 
-    return result.get("result", {}).get("value", "")
 
+def get_page_state_and_cookies(session: CDPSession) -> tuple[dict, list[dict]]:
+    """Get the page state (see get_page_state) and cookies in one round-trip."""
+    state_result, cookies_result = session.send_many([
+        ("Runtime.evaluate", {"expression": _PAGE_STATE_JS, "returnByValue": True}),
+        ("Network.getCookies", {"urls": _COOKIE_URLS}),
+    ])
+    return _parse_page_state(state_result), cookies_result.get("cookies", [])
 
-def navigate_to_url(ws_url: str, url: str) -> None:
-    """Navigate the page to a URL."""
-    execute_cdp_command(ws_url, "Page.enable")
-    execute_cdp_command(ws_url, "Page.navigate", {"url": url})
-    # Wait for page to load
-    time.sleep(3)
 
+def wait_for_login(session: CDPSession, max_wait: float = 300) -> str | None:
+    """Block until the page lands on NotebookLM with a logged-in session.
 
-def get_current_url(ws_url: str) -> str:
-    """Get the current page URL via CDP (cheap operation, no JS evaluation)."""
-    execute_cdp_command(ws_url, "Runtime.enable")
-    result = execute_cdp_command(
-        ws_url,
-        "Runtime.evaluate",
-        {"expression": "window.location.href"}
-    )
-    return result.get("result", {}).get("value", "")
+    Waits for top-level frame navigations instead of polling the URL - no
+    extra round-trips while the user logs in, and login is detected as soon
+    as the redirect happens. The caller must have sent Page.enable; navigations
+    that arrived while other commands ran are picked up from the session's
+    event buffer.
+
+    A navigation fires at commit, before the document is parsed, so this
+    then waits for the page to load - the auth tokens are inline in it.
+
+    Args:
+        session: CDP session for the NotebookLM page (Page events enabled)
+        max_wait: Maximum seconds to wait
+
+    Returns:
+        The logged-in URL, or None if max_wait elapsed first
+    """
+    deadline = time.monotonic() + max_wait
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        try:
+            event = session.recv_event(timeout=remaining)
+        except TimeoutError:
+            return None
+
+        if event.get("method") != "Page.frameNavigated":
+            continue
+
+        frame = event.get("params", {}).get("frame", {})
+        if "parentId" in frame:
+            continue  # Only the top frame reflects the page URL
+
+        url = frame.get("url", "")
+        if check_if_logged_in_by_url(url):
+            wait_for_load(session)
+            return url
 
 
 def check_if_logged_in_by_url(url: str) -> bool:
@@ -262,20 +517,40 @@ def check_if_logged_in_by_url(url: str) -> bool:
     return False
 
 
-def extract_session_id_from_html(html: str) -> str:
-    """Extract session ID from page HTML."""
-    patterns = [
-        r'"FdrFJe":"(\d+)"',
-        r'f\.sid["\s:=]+["\']?(\d+)',
-        r'"cfb2h":"([^"]+)"',
-    ]
+# CSRF token and session ID locations, combined so the HTML is scanned once.
+# FdrFJe is shared: numeric values are the session ID, and it is also the
+# last-resort CSRF location.
+_AUTH_TOKENS_RE = re.compile(
+    r'"SNlM0e":"(?P<snlm0e>[^"]+)"'
+    r'|"FdrFJe":"(?P<fdrfje>[^"]+)"'
+    r'|f\.sid["\s:=]+["\']?(?P<fsid>\d+)'
+    r'|"cfb2h":"(?P<cfb2h>[^"]+)"'
+    r'|at=(?P<at>[^&"]+)'
+)
 
-    for pattern in patterns:
-        match = re.search(pattern, html)
-        if match:
-            return match.group(1)
 
-    return ""
+def extract_auth_tokens(html: str) -> tuple[str, str]:
+    """Extract the CSRF token and session ID from page HTML in a single pass.
+
+    CSRF priority: SNlM0e, at=, FdrFJe. Session ID priority: numeric FdrFJe,
+    f.sid, cfb2h.
+
+    Returns:
+        Tuple of (csrf_token, session_id), "" for anything not found
+    """
+    found = {}
+    for match in _AUTH_TOKENS_RE.finditer(html):
+        name = match.lastgroup
+        value = match.group(name)
+        if name == "fdrfje" and value.isdigit():
+            found.setdefault("fdrfje_sid", value)
+        found.setdefault(name, value)
+        if "snlm0e" in found and "fdrfje_sid" in found:
+            break  # Both top-priority tokens found
+
+    csrf_token = found.get("snlm0e") or found.get("at") or found.get("fdrfje") or ""
+    session_id = found.get("fdrfje_sid") or found.get("fsid") or found.get("cfb2h") or ""
+    return csrf_token, session_id
 
 
 def is_chrome_profile_locked(profile_dir: str | None = None) -> bool:
@@ -293,13 +568,27 @@ def is_chrome_profile_locked(profile_dir: str | None = None) -> bool:
     if profile_dir is None:
         # Check OUR profile, not the default Chrome profile
         # We use a separate profile so we can run alongside the user's main Chrome
-        profile_dir = str(Path.home() / ".notebooklm-mcp" / "chrome-profile")
+        profile_dir = str(_PROFILE_DIR)
 
     # Chrome creates a "SingletonLock" file when the profile is in use
     lock_file = Path(profile_dir) / "SingletonLock"
     return lock_file.exists()
 
 
+def is_port_in_use(port: int) -> bool:
+    """Check if anything is listening on a local port.
+
+    A plain TCP connect - no process listing or subprocess needed. Combined
+    with a failed /json/version probe it means the port is held by something
+    other than Chrome's debugger.
+    """
+    try:
+        with socket.create_connection(("localhost", port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
 def is_our_chrome_profile_in_use() -> bool:
     """Check if OUR Chrome profile is already in use.
 
@@ -312,132 +601,172 @@ def is_our_chrome_profile_in_use() -> bool:
     return is_chrome_profile_locked()  # Already checks our profile by default
 
 
-def run_auth_flow(port: int = CDP_DEFAULT_PORT, auto_launch: bool = True) -> AuthTokens | None:
-    """Run the authentication flow.
+def discover_notebooklm_page(
+    port: int = CDP_DEFAULT_PORT, auto_launch: bool = True
+) -> tuple[dict | None, bool]:
+    """Connect to Chrome's debugger (launching it if needed) and find the NotebookLM page.
 
     Args:
         port: Chrome DevTools port
         auto_launch: If True, automatically launch Chrome if not running
+
+    Returns:
+        Tuple of (page, already_on_notebooklm) - see find_or_create_notebooklm_page
     """
-    print("NotebookLM MCP Authentication")
-    print("=" * 40)
-    print()
+    try:
+        # Check if Chrome is running with debugging
+        debugger_url = get_chrome_debugger_url(port)
 
-    # Check if Chrome is running with debugging
-    debugger_url = get_chrome_debugger_url(port)
+        if not debugger_url and auto_launch:
+            # Launching would only wait for a debugger that can never bind
+            if is_port_in_use(port):
+                print(f"ERROR: Port {port} is in use by something other than Chrome's debugger.")
+                print("Free the port or pick another with --port.")
+                print()
+                return None, False
+
+            # Check if our specific profile is already in use
+            if is_our_chrome_profile_in_use():
+                print("The NotebookLM auth profile is already in use.")
+                print()
+                print("This means a previous auth Chrome window is still open.")
+                print("Close that window and try again, or use file mode:")
+                print()
+                print("  notebooklm-mcp-auth --file")
+                print()
+                return None, False
+
+            # We can launch our separate Chrome profile even if user's main Chrome is open
+            print("Launching Chrome with NotebookLM auth profile...")
+            print("(First time: you'll need to log in to your Google account)")
+            print()
+            # Launch with visible window so user can log in
+            launch_chrome(port, headless=False)
+            debugger_url = get_chrome_debugger_url(port)
 
-    if not debugger_url and auto_launch:
-        # Check if our specific profile is already in use
-        if is_our_chrome_profile_in_use():
-            print("The NotebookLM auth profile is already in use.")
+        if not debugger_url:
+            print(f"ERROR: Cannot connect to Chrome on port {port}")
             print()
-            print("This means a previous auth Chrome window is still open.")
-            print("Close that window and try again, or use file mode:")
+            print("This can happen if:")
+            print("  - Chrome failed to start")
+            print(f"  - Another process is using port {port}")
+            print("  - Firewall is blocking the port")
             print()
-            print("  notebooklm-mcp-auth --file")
+            print("TRY: Use file mode instead (most reliable):")
+            print("     notebooklm-mcp-auth --file")
             print()
-            return None
+            return None, False
 
-        # We can launch our separate Chrome profile even if user's main Chrome is open
-        print("Launching Chrome with NotebookLM auth profile...")
-        print("(First time: you'll need to log in to your Google account)")
-        print()
-        # Launch with visible window so user can log in
-        launch_chrome(port, headless=False)
-        time.sleep(3)
-        debugger_url = get_chrome_debugger_url(port)
+        print(f"Connected to Chrome debugger")
 
-    if not debugger_url:
-        print(f"ERROR: Cannot connect to Chrome on port {port}")
-        print()
-        print("This can happen if:")
-        print("  - Chrome failed to start")
-        print("  - Another process is using port 9222")
-        print("  - Firewall is blocking the port")
-        print()
-        print("TRY: Use file mode instead (most reliable):")
-        print("     notebooklm-mcp-auth --file")
-        print()
-        return None
-
-    print(f"Connected to Chrome debugger")
+        # Find or create NotebookLM page
+        page, on_notebooklm = find_or_create_notebooklm_page(port)
+    finally:
+        # Discovery is done - release the pooled DevTools connection
+        _close_client()
 
-    # Find or create NotebookLM page
-    page = find_or_create_notebooklm_page(port)
     if not page:
         print("ERROR: Failed to find or create NotebookLM page")
-        return None
-
-    ws_url = page.get("webSocketDebuggerUrl")
-    if not ws_url:
-        print("ERROR: No WebSocket URL for page")
-        return None
+        return None, False
 
     print(f"Using page: {page.get('title', 'Unknown')}")
+    return page, on_notebooklm
 
-    # Navigate to NotebookLM if needed
-    current_url = page.get("url", "")
-    if "notebooklm.google.com" not in current_url:
-        print("Navigating to NotebookLM...")
-        navigate_to_url(ws_url, NOTEBOOKLM_URL)
 
-    # Check login status by URL (cheap - no HTML parsing)
-    print("Checking login status...")
-    current_url = get_current_url(ws_url)
+def run_auth_flow(port: int = CDP_DEFAULT_PORT, auto_launch: bool = True) -> AuthTokens | None:
+    """Run the authentication flow.
 
-    if not check_if_logged_in_by_url(current_url):
-        print()
-        print("=" * 40)
-        print("NOT LOGGED IN")
-        print("=" * 40)
-        print()
-        print("Please log in to NotebookLM in the Chrome window.")
-        print("This tool will wait for you to complete login...")
-        print()
-        print("(Press Ctrl+C to cancel)")
-        print()
+    Args:
+        port: Chrome DevTools port
+        auto_launch: If True, automatically launch Chrome if not running
+    """
+    print("NotebookLM MCP Authentication")
+    print("=" * 40)
+    print()
 
-        # Wait for login - check URL every 5 seconds (cheap operation)
-        max_wait = 300  # 5 minutes
-        start_time = time.time()
-        while time.time() - start_time < max_wait:
-            time.sleep(5)
-            try:
-                current_url = get_current_url(ws_url)
-                if check_if_logged_in_by_url(current_url):
-                    print("Login detected!")
-                    break
-            except Exception as e:
-                print(f"Waiting... ({e})")
-
-        if not check_if_logged_in_by_url(current_url):
-            print("ERROR: Login timeout. Please try again.")
+    # Reuse the page from the last run if it is still open - skips discovery
+    page = _load_cached_cdp(port)
+    on_notebooklm = False
+    if page:
+        print("Reusing Chrome page from last run")
+    else:
+        page, on_notebooklm = discover_notebooklm_page(port, auto_launch)
+        if not page:
             return None
 
-    # Extract cookies
-    print("Extracting cookies...")
-    cookies_list = get_page_cookies(ws_url)
-    cookies = {c["name"]: c["value"] for c in cookies_list}
-
-    if not validate_cookies(cookies):
-        print("ERROR: Missing required cookies. Please ensure you're fully logged in.")
-        print(f"Required: {REQUIRED_COOKIES}")
-        print(f"Found: {list(cookies.keys())}")
+    ws_url = page.get("webSocketDebuggerUrl")
+    if not ws_url:
+        print("ERROR: No WebSocket URL for page")
         return None
 
-    # Get page HTML for CSRF extraction
-    html = get_page_html(ws_url)
+    _save_cached_cdp(page)
+
+    with CDPSession(ws_url) as session:
+        # Subscribe to Page events before checking the URL. A login
+        # navigation between the check and the wait is buffered by the
+        # session (even while the check's commands run) and seen by
+        # wait_for_login
+        session.send("Page.enable")
+
+        # Navigate to NotebookLM if needed (a cached page has no known URL)
+        if not on_notebooklm:
+            current_url = page.get("url") or get_page_state(session)["url"]
+            if "notebooklm.google.com" not in current_url:
+                print("Navigating to NotebookLM...")
+                navigate_to_url(session, NOTEBOOKLM_URL)
+
+        # Check login status by URL (tokens and cookies come back in the same round-trip)
+        print("Checking login status...")
+        state, cookies_list = get_page_state_and_cookies(session)
+        if check_if_logged_in_by_url(state["url"]) and state["ready"] != "complete":
+            # Still loading - the tokens may not be in the document yet
+            wait_for_load(session)
+            state, cookies_list = get_page_state_and_cookies(session)
+
+        if not check_if_logged_in_by_url(state["url"]):
+            print()
+            print("=" * 40)
+            print("NOT LOGGED IN")
+            print("=" * 40)
+            print()
+            print("Please log in to NotebookLM in the Chrome window.")
+            print("This tool will wait for you to complete login...")
+            print()
+            print("(Press Ctrl+C to cancel)")
+            print()
 
-    # Extract CSRF token
-    print("Extracting CSRF token...")
-    csrf_token = extract_csrf_from_page_source(html)
-    if not csrf_token:
-        print("WARNING: Could not extract CSRF token from page.")
-        print("You may need to extract it manually from Network tab.")
-        csrf_token = ""
+            # Wait for login - react to the post-login navigation (5 minute cap)
+            if not wait_for_login(session, max_wait=300):
+                print("ERROR: Login timeout. Please try again.")
+                return None
+            print("Login detected!")
+            state, cookies_list = get_page_state_and_cookies(session)
+
+        # Extract cookies
+        print("Extracting cookies...")
+        cookies = {c["name"]: c["value"] for c in cookies_list if c["name"] in ESSENTIAL_COOKIES}
+
+        missing = REQUIRED_COOKIES - cookies.keys()
+        if missing:
+            print("ERROR: Missing required cookies. Please ensure you're fully logged in.")
+            print(f"Missing: {sorted(missing)}")
+            print(f"Found: {list(cookies.keys())}")
+            return None
+
+        # Tokens were extracted in-page along with the login check
+        print("Extracting CSRF token...")
+        csrf_token = state["csrf"]
+        session_id = state["sid"]
 
-    # Extract session ID
-    session_id = extract_session_id_from_html(html)
+        if not csrf_token:
+            # Fall back to the raw server response, which carries the inline
+            # tokens even if the rendered DOM doesn't
+            csrf_token, body_session_id = extract_auth_tokens(get_document_body(session))
+            session_id = session_id or body_session_id
+
+        if not csrf_token:
+            print("WARNING: Could not extract CSRF token from page.")
+            print("You may need to extract it manually from Network tab.")
 
     # Create tokens object
     tokens = AuthTokens(
@@ -560,12 +889,9 @@ def run_file_cookie_entry(cookie_file: str | None = None) -> AuthTokens | None:
     print("Validating cookies...")
 
     # Parse cookies from header format (key=value; key=value; ...)
-    cookies = {}
-    for cookie in cookie_string.split(";"):
-        cookie = cookie.strip()
-        if "=" in cookie:
-            key, value = cookie.split("=", 1)
-            cookies[key.strip()] = value.strip()
+    from .api_client import extract_cookies_from_chrome_export  # Pulls in httpx
+
+    cookies = extract_cookies_from_chrome_export(cookie_string)
 
     if not cookies:
         print("\nERROR: Could not parse any cookies from input.")
@@ -575,9 +901,10 @@ def run_file_cookie_entry(cookie_file: str | None = None) -> AuthTokens | None:
         return None
 
     # Validate required cookies
-    if not validate_cookies(cookies):
+    missing = REQUIRED_COOKIES - cookies.keys()
+    if missing:
         print("\nWARNING: Some required cookies are missing!")
-        print(f"Required: {REQUIRED_COOKIES}")
+        print(f"Missing: {sorted(missing)}")
         print(f"Found: {list(cookies.keys())}")
         print()
         print("Continuing anyway...")
@@ -1,10 +1,68 @@
 """NotebookLM MCP Server."""
 
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any
 
-from fastmcp import FastMCP
+import httpx
+from fastmcp import Context, FastMCP
 
-from .api_client import NotebookLMClient, extract_cookies_from_chrome_export, parse_timestamp
+from .api_client import (
+    MAX_CONCURRENCY,
+    CreateArtifactError,
+    NotebookLMClient,
+    extract_cookies_from_chrome_export,
+    parse_timestamp,
+)
+from .auth import (
+    ESSENTIAL_COOKIES,
+    REQUIRED_COOKIES,
+    AuthTokens,
+    get_cache_path,
+    load_cached_tokens,
+    save_tokens_to_cache,
+)
+
+# Full usage guide, served on demand as the docs://instructions resource
+# so it isn't sent with every MCP handshake
+INSTRUCTIONS_FULL = """NotebookLM MCP - Access NotebookLM (notebooklm.google.com).
+
+## Auth
+Use save_auth_tokens with cookies from Chrome DevTools (or run notebooklm-mcp-auth).
+CSRF token and session ID are auto-extracted. Pass request_body/request_url from a
+batchexecute network request to skip the page fetch on first use.
+
+## Confirmation
+Tools with a confirm param (deletes, Drive sync, studio content) require user approval
+before setting confirm=True. Without it they return the settings to show the user.
+
+## Workflows
+- Explore: notebook_list -> notebook_get / notebook_describe -> notebook_query.
+  Use fields on notebook_list/notebook_get to return only what you need.
+- Research: research_start -> research_status (blocks, backs off) -> research_import.
+  Pass research.sources from research_status (compact=False) as sources_snapshot
+  to research_import to skip re-fetching results.
+- Drive: source_list_drive shows stale sources -> source_sync_drive(confirm=True).
+- Studio: audio/video/infographic/slides/report/flashcards/quiz/data table creators
+  start generation; poll studio_status for completion and URLs.
+
+## Caching
+notebook_list, notebook_get, source lists and Drive freshness are cached for a few
+seconds and refreshed automatically after changes made through this server.
+"""
 
 # Initialize MCP server
 mcp = FastMCP(
@@ -13,11 +71,146 @@ mcp = FastMCP(
 
 **Auth:** Use save_auth_tokens with cookies from Chrome DevTools. CSRF/session auto-extracted.
 **Confirmation:** Tools with confirm param require user approval before setting confirm=True.
-**Studio:** After creating audio/video/infographic/slides, poll studio_status for completion.""",
+**Studio:** After creating audio/video/infographic/slides, poll studio_status for completion.
+**Guide:** Read the docs://instructions resource for workflows and tips.""",
 )
 
+
+@mcp.resource("docs://instructions")
+def instructions() -> str:
+    """Full usage guide for the NotebookLM tools."""
+    return INSTRUCTIONS_FULL
+
+# Notebook URLs returned by tools are this prefix + notebook ID
+_NB_URL_PREFIX = "https://notebooklm.google.com/notebook/"
+
 # Global state
 _client: NotebookLMClient | None = None
+_client_lock = threading.Lock()
+
+# At most MAX_CONCURRENCY API client calls in flight at once
+_call_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+# Max Drive sources synced at once by source_sync_drive
+SYNC_CONCURRENCY = int(os.environ.get("NOTEBOOKLM_SYNC_CONCURRENCY", "5"))
+
+# Attempts per source when source_sync_drive is rate limited (HTTP 429)
+SYNC_ATTEMPTS = 3
+
+# First research_status poll delay in seconds (backs off up to poll_interval)
+RESEARCH_POLL_INITIAL = 2.0
+
+# Sources per import request in research_import (batches are sent in parallel)
+RESEARCH_IMPORT_BATCH = 8
+
+
+class _TTLCache:
+    """A small dict-backed cache whose entries expire after ttl seconds.
+
+    Expired entries are kept for another `stale` seconds, for get_stale().
+    When full, the oldest entry is evicted (dicts keep insertion order).
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024, stale: float = 0):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale = stale
+        # Bumped by pop/clear, so a refresh started before can tell it's outdated
+        self.version = 0
+        self._data: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value, is_fresh = self.get_stale(key, default)
+        return value if is_fresh else default
+
+    def get_stale(self, key: Any, default: Any = None) -> tuple[Any, bool]:
+        """Get (value, is_fresh), including expired entries still within `stale`."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default, False
+        expires_at, value = entry
+        now = time.monotonic()
+        if expires_at < now:
+            if expires_at + self.stale < now:
+                self._data.pop(key, None)
+                return default, False
+            return value, False
+        return value, True
+
+    def set(self, key: Any, value: Any) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Any) -> None:
+        self.version += 1
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._data.clear()
+
+
+# Short-lived caches for repeated source_list_drive and studio tool calls in a session
+_freshness_cache = _TTLCache(ttl=60, maxsize=4096)  # source_id -> is_fresh
+_sources_cache = _TTLCache(ttl=15)  # notebook_id -> sources with types
+
+# Short-lived caches for repeated notebook_list / notebook_get calls. For a
+# minute after expiring, entries are still served while refreshed in the
+# background (see _get_revalidated)
+_notebooks_cache = _TTLCache(ttl=15, maxsize=1, stale=60)  # "all" -> list_notebooks result
+_notebook_cache = _TTLCache(ttl=15, maxsize=256, stale=60)  # notebook_id -> get_notebook result
+
+# Answers to repeated notebook_query calls (new conversations only)
+_query_cache = _TTLCache(ttl=60, maxsize=128)  # digest of inputs -> query result
+
+# Completed research seen by research_status, reused by a following research_import
+_research_cache = _TTLCache(ttl=5, maxsize=64)  # notebook_id -> poll_research result
+
+
+def _invalidate_notebook(notebook_id: str | None = None) -> None:
+    """Drop cached data for a notebook after it (or its sources) changed.
+
+    Without a notebook_id, cached data for all notebooks is dropped.
+    The notebook list is always dropped since it includes source counts,
+    and so are cached query answers, which aren't indexed by notebook.
+    """
+    _notebooks_cache.clear()
+    _query_cache.clear()
+    if notebook_id is None:
+        _notebook_cache.clear()
+        _sources_cache.clear()
+    else:
+        _notebook_cache.pop(notebook_id)
+        _sources_cache.pop(notebook_id)
+
+
+def _ok(**fields: Any) -> dict[str, Any]:
+    """Build a tool success response."""
+    return {"status": "success", **fields}
+
+
+def _err(message: str, **extra: Any) -> dict[str, Any]:
+    """Build a tool error response."""
+    return {"status": "error", "error": message, **extra}
+
+
+def _tool_errors(func):
+    """Turn exceptions raised by an async tool into error responses.
+
+    Sits under @mcp.tool(); functools.wraps keeps the tool's signature and
+    docstring, which FastMCP reads for the tool schema.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except CreateArtifactError as e:
+            # A studio create RPC returned no artifact ("Failed to create ...")
+            return _err(str(e))
+        except Exception as e:
+            return _err(str(e))
+    return wrapper
 
 
 def get_client() -> NotebookLMClient:
@@ -26,143 +219,290 @@ def get_client() -> NotebookLMClient:
     Tries environment variables first, falls back to cached tokens from auth CLI.
     """
     global _client
-    if _client is None:
-        import os
+    client = _client
+    if client is not None:
+        return client
+
+    # Tool calls run in worker threads - make sure concurrent first calls
+    # build only one client
+    with _client_lock:
+        if _client is None:
+            cookie_header = os.environ.get("NOTEBOOKLM_COOKIES", "")
+            csrf_token = os.environ.get("NOTEBOOKLM_CSRF_TOKEN", "")
+            session_id = os.environ.get("NOTEBOOKLM_SESSION_ID", "")
+
+            if cookie_header:
+                # Use environment variables
+                cookies = extract_cookies_from_chrome_export(cookie_header)
+            else:
+                # Try cached tokens from auth CLI
+                cached = load_cached_tokens()
+                if cached:
+                    cookies = cached.cookies
+                    csrf_token = csrf_token or cached.csrf_token
+                    session_id = session_id or cached.session_id
+                else:
+                    raise ValueError(
+                        "No authentication found. Either:\n"
+                        "1. Run 'notebooklm-mcp-auth' to authenticate via Chrome, or\n"
+                        "2. Set NOTEBOOKLM_COOKIES environment variable manually"
+                    )
 
-        from .auth import load_cached_tokens
+            _client = NotebookLMClient(
+                cookies=cookies,
+                csrf_token=csrf_token,
+                session_id=session_id,
+            )
+        return _client
 
-        cookie_header = os.environ.get("NOTEBOOKLM_COOKIES", "")
-        csrf_token = os.environ.get("NOTEBOOKLM_CSRF_TOKEN", "")
-        session_id = os.environ.get("NOTEBOOKLM_SESSION_ID", "")
 
-        if cookie_header:
-            # Use environment variables
-            cookies = extract_cookies_from_chrome_export(cookie_header)
-        else:
-            # Try cached tokens from auth CLI
-            cached = load_cached_tokens()
-            if cached:
-                cookies = cached.cookies
-                csrf_token = csrf_token or cached.csrf_token
-                session_id = session_id or cached.session_id
-            else:
-                raise ValueError(
-                    "No authentication found. Either:\n"
-                    "1. Run 'notebooklm-mcp-auth' to authenticate via Chrome, or\n"
-                    "2. Set NOTEBOOKLM_COOKIES environment variable manually"
-                )
+def _close_client() -> None:
+    """Close the API client's pooled connections when the server exits."""
+    if _client is not None:
+        _client.close()
 
-        _client = NotebookLMClient(
-            cookies=cookies,
-            csrf_token=csrf_token,
-            session_id=session_id,
-        )
-    return _client
+
+atexit.register(_close_client)
+
+
+async def _call(func, *args, **kwargs):
+    """Run a blocking client call in a worker thread.
+
+    The API client is synchronous; running it off the event loop lets the
+    server handle other tool calls while a request to NotebookLM is in flight.
+    At most MAX_CONCURRENCY calls run at once.
+    """
+    async with _call_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# In-flight background refreshes: (cache id, key) -> task
+_revalidations: dict[tuple[int, Any], asyncio.Task] = {}
+
+
+async def _get_revalidated(cache: _TTLCache, key: Any, func, *args) -> Any:
+    """Get func(*args) through cache, stale-while-revalidate.
+
+    A fresh entry is returned as is. A stale one is returned too, while a
+    background task refreshes it. Only a miss waits for func.
+    """
+    value, is_fresh = cache.get_stale(key)
+    if value is None:
+        value = await _call(func, *args)
+        cache.set(key, value)
+    elif not is_fresh and (id(cache), key) not in _revalidations:
+        token = (id(cache), key)
+        task = asyncio.create_task(_revalidate(cache, cache.version, key, func, *args))
+        _revalidations[token] = task
+        task.add_done_callback(lambda _: _revalidations.pop(token, None))
+    return value
+
+
+async def _revalidate(cache: _TTLCache, version: int, key: Any, func, *args) -> None:
+    """Refresh a stale cache entry, unless it was invalidated since version."""
+    try:
+        value = await _call(func, *args)
+    except Exception:
+        return  # Keep serving the stale entry until it expires
+    if cache.version == version:
+        cache.set(key, value)
+
+
+async def _cached_sources(client: NotebookLMClient, notebook_id: str) -> list[dict]:
+    """Get a notebook's sources with types, via the short-lived sources cache.
+
+    The returned dicts are shared with the cache and must not be modified.
+    """
+    sources = _sources_cache.get(notebook_id)
+    if sources is None:
+        sources = await _call(client.get_notebook_sources_with_types, notebook_id)
+        _sources_cache.set(notebook_id, sources)
+    return sources
+
+
+async def _get_sources_with_types(client: NotebookLMClient, notebook_id: str) -> list[dict]:
+    """Get a notebook's sources with types, as copies callers can annotate freely."""
+    return [dict(src) for src in await _cached_sources(client, notebook_id)]
+
+
+async def _default_source_ids(client: NotebookLMClient, notebook_id: str) -> list[str]:
+    """Get the IDs of all of a notebook's sources - the studio tools' default."""
+    return [src["id"] for src in await _cached_sources(client, notebook_id) if src.get("id")]
+
+
+async def _check_freshness_many(client: NotebookLMClient, source_ids: list[str]) -> dict[str, bool | None]:
+    """Check if Drive sources are fresh, via the freshness cache.
+
+    Cache misses are checked together in a single batched request. Sources
+    the batch response left out are then checked one by one, in parallel.
+    Unknown results (None) are not cached so they are retried next time.
+    """
+    freshness = {source_id: _freshness_cache.get(source_id) for source_id in source_ids}
+    misses = [source_id for source_id, is_fresh in freshness.items() if is_fresh is None]
+
+    if misses:
+        fetched = await _call(client.check_sources_freshness_batch, misses)
+
+        unknown = [source_id for source_id in misses if fetched.get(source_id) is None]
+        if unknown:
+            retried = await asyncio.gather(
+                *(_call(client.check_source_freshness, source_id) for source_id in unknown),
+                return_exceptions=True,
+            )
+            for source_id, is_fresh in zip(unknown, retried):
+                if not isinstance(is_fresh, Exception):
+                    fetched[source_id] = is_fresh
+
+        for source_id, is_fresh in fetched.items():
+            if is_fresh is not None:
+                _freshness_cache.set(source_id, is_fresh)
+        freshness.update(fetched)
+
+    return freshness
+
+
+# Fields of each notebook returned by notebook_list (Notebook attributes)
+_NOTEBOOK_LIST_FIELDS = (
+    "id", "title", "source_count", "url", "ownership", "is_shared", "created_at", "modified_at",
+)
+
+
+def _attrs_getter(names: tuple[str, ...]) -> Callable[[Any], tuple]:
+    """Build a C-level getter returning a tuple of the named attributes.
+
+    Unlike attrgetter alone, always returns a tuple (even for 0 or 1 names).
+    """
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        get_one = attrgetter(names[0])
+        return lambda obj: (get_one(obj),)
+    return lambda obj: ()
+
+
+_NOTEBOOK_LIST_GETTER = _attrs_getter(_NOTEBOOK_LIST_FIELDS)
+
+# Response fields of notebook_get
+_NOTEBOOK_GET_FIELDS = ("notebook", "created_at", "modified_at")
+
+
+def _check_fields(fields: list[str], valid: tuple[str, ...]) -> str | None:
+    """Return an error message if any requested field is unknown."""
+    unknown = [f for f in fields if f not in valid]
+    if unknown:
+        return f"Unknown fields: {unknown}. Use: {', '.join(valid)}"
+    return None
 
 
 @mcp.tool()
-def notebook_list(max_results: int = 100) -> dict[str, Any]:
+@_tool_errors
+async def notebook_list(max_results: int = 100, fields: list[str] | None = None) -> dict[str, Any]:
     """List all notebooks.
 
     Args:
         max_results: Maximum number of notebooks to return (default: 100)
+        fields: Fields per notebook, e.g. ["id", "title"] (default or empty: all).
+                id|title|source_count|url|ownership|is_shared|created_at|modified_at
     """
-    try:
-        client = get_client()
-        notebooks = client.list_notebooks()
-
-        # Count owned vs shared notebooks
-        owned_count = sum(1 for nb in notebooks if nb.is_owned)
-        shared_count = len(notebooks) - owned_count
-        
-        # Count notebooks shared by me (owned + is_shared=True)
-        shared_by_me_count = sum(1 for nb in notebooks if nb.is_owned and nb.is_shared)
-
-        return {
-            "status": "success",
-            "count": len(notebooks),
-            "owned_count": owned_count,
-            "shared_count": shared_count,
-            "shared_by_me_count": shared_by_me_count,
-            "notebooks": [
-                {
-                    "id": nb.id,
-                    "title": nb.title,
-                    "source_count": nb.source_count,
-                    "url": nb.url,
-                    "ownership": nb.ownership,
-                    "is_shared": nb.is_shared,
-                    "created_at": nb.created_at,
-                    "modified_at": nb.modified_at,
-                }
-                for nb in notebooks[:max_results]
-            ],
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if not fields:
+        fields = _NOTEBOOK_LIST_FIELDS
+        get_values = _NOTEBOOK_LIST_GETTER
+    elif error := _check_fields(fields, _NOTEBOOK_LIST_FIELDS):
+        return _err(error)
+    else:
+        fields = tuple(fields)
+        get_values = _attrs_getter(fields)
+
+    client = await _call(get_client)
+    notebooks = await _get_revalidated(_notebooks_cache, "all", client.list_notebooks)
+
+    # Count owned, shared and shared-by-me (owned + is_shared=True)
+    # notebooks and build the response list in one pass
+    owned_count = 0
+    shared_by_me_count = 0
+    results = []
+    for i, nb in enumerate(notebooks):
+        if nb.is_owned:
+            owned_count += 1
+            if nb.is_shared:
+                shared_by_me_count += 1
+        if i < max_results:
+            results.append(dict(zip(fields, get_values(nb))))
+
+    return _ok(
+        count=len(notebooks),
+        owned_count=owned_count,
+        shared_count=len(notebooks) - owned_count,
+        shared_by_me_count=shared_by_me_count,
+        notebooks=results,
+    )
 
 
 @mcp.tool()
-def notebook_create(title: str = "") -> dict[str, Any]:
+@_tool_errors
+async def notebook_create(title: str = "") -> dict[str, Any]:
     """Create a new notebook.
 
     Args:
         title: Optional title for the notebook
     """
-    try:
-        client = get_client()
-        notebook = client.create_notebook(title=title)
-
-        if notebook:
-            return {
-                "status": "success",
-                "notebook": {
-                    "id": notebook.id,
-                    "title": notebook.title,
-                    "url": notebook.url,
-                },
-            }
-        return {"status": "error", "error": "Failed to create notebook"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    client = await _call(get_client)
+    notebook = await _call(client.create_notebook, title=title)
+    _notebooks_cache.clear()
+
+    if notebook:
+        return _ok(
+            notebook={
+                "id": notebook.id,
+                "title": notebook.title,
+                "url": notebook.url,
+            },
+        )
+    return _err("Failed to create notebook")
 
 
 @mcp.tool()
-def notebook_get(notebook_id: str) -> dict[str, Any]:
+@_tool_errors
+async def notebook_get(notebook_id: str, fields: list[str] | None = None) -> dict[str, Any]:
     """Get notebook details with sources.
 
     Args:
         notebook_id: Notebook UUID
+        fields: Response fields, e.g. ["created_at", "modified_at"] (default or empty: all).
+                notebook|created_at|modified_at
     """
-    try:
-        client = get_client()
-        result = client.get_notebook(notebook_id)
-
-        # Extract timestamps from metadata if available
-        # Result structure: [title, sources, id, emoji, null, metadata, ...]
-        # metadata[5] = modified_at, metadata[8] = created_at
-        created_at = None
-        modified_at = None
-        if result and isinstance(result, list) and len(result) > 5:
-            metadata = result[5]
-            if isinstance(metadata, list):
-                if len(metadata) > 5:
-                    modified_at = parse_timestamp(metadata[5])
-                if len(metadata) > 8:
-                    created_at = parse_timestamp(metadata[8])
-
-        return {
-            "status": "success",
-            "notebook": result,
-            "created_at": created_at,
-            "modified_at": modified_at,
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if not fields:
+        fields = _NOTEBOOK_GET_FIELDS
+    elif error := _check_fields(fields, _NOTEBOOK_GET_FIELDS):
+        return _err(error)
+
+    client = await _call(get_client)
+    result = await _get_revalidated(_notebook_cache, notebook_id, client.get_notebook, notebook_id)
+
+    # Extract timestamps from metadata if available
+    # Result structure: [title, sources, id, emoji, null, metadata, ...]
+    # metadata[5] = modified_at, metadata[8] = created_at
+    created_at = None
+    modified_at = None
+    if result and isinstance(result, list) and len(result) > 5:
+        metadata = result[5]
+        if isinstance(metadata, list):
+            if len(metadata) > 5:
+                modified_at = parse_timestamp(metadata[5])
+            if len(metadata) > 8:
+                created_at = parse_timestamp(metadata[8])
+
+    response = {
+        "notebook": result,
+        "created_at": created_at,
+        "modified_at": modified_at,
+    }
+    return _ok(**{field: response[field] for field in fields})
 
 
 @mcp.tool()
-def notebook_describe(notebook_id: str) -> dict[str, Any]:
+@_tool_errors
+async def notebook_describe(notebook_id: str) -> dict[str, Any]:
     """Get AI-generated notebook summary with suggested topics.
 
     Args:
@@ -170,20 +510,17 @@ def notebook_describe(notebook_id: str) -> dict[str, Any]:
 
     Returns: summary (markdown), suggested_topics list
     """
-    try:
-        client = get_client()
-        result = client.get_notebook_summary(notebook_id)
+    client = await _call(get_client)
+    result = await _call(client.get_notebook_summary, notebook_id)
 
-        return {
-            "status": "success",
-            **result,  # Includes summary and suggested_topics
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _ok(
+        **result,  # Includes summary and suggested_topics
+    )
 
 
 @mcp.tool()
-def source_describe(source_id: str) -> dict[str, Any]:
+@_tool_errors
+async def source_describe(source_id: str) -> dict[str, Any]:
     """Get AI-generated source summary with keyword chips.
 
     Args:
@@ -191,20 +528,17 @@ def source_describe(source_id: str) -> dict[str, Any]:
 
     Returns: summary (markdown with **bold** keywords), keywords list
     """
-    try:
-        client = get_client()
-        result = client.get_source_guide(source_id)
+    client = await _call(get_client)
+    result = await _call(client.get_source_guide, source_id)
 
-        return {
-            "status": "success",
-            **result,  # Includes summary and keywords
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _ok(
+        **result,  # Includes summary and keywords
+    )
 
 
 @mcp.tool()
-def source_get_content(source_id: str) -> dict[str, Any]:
+@_tool_errors
+async def source_get_content(source_id: str) -> dict[str, Any]:
     """Get raw text content of a source (no AI processing).
 
     Returns the original indexed text from PDFs, web pages, pasted text,
@@ -215,42 +549,35 @@ def source_get_content(source_id: str) -> dict[str, Any]:
 
     Returns: content (str), title (str), source_type (str), char_count (int)
     """
-    try:
-        client = get_client()
-        result = client.get_source_fulltext(source_id)
+    client = await _call(get_client)
+    result = await _call(client.get_source_fulltext, source_id)
 
-        return {
-            "status": "success",
-            **result,  # Includes content, title, source_type, url, char_count
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _ok(
+        **result,  # Includes content, title, source_type, url, char_count
+    )
 
 
 @mcp.tool()
-def notebook_add_url(notebook_id: str, url: str) -> dict[str, Any]:
+@_tool_errors
+async def notebook_add_url(notebook_id: str, url: str) -> dict[str, Any]:
     """Add URL (website or YouTube) as source.
 
     Args:
         notebook_id: Notebook UUID
         url: URL to add
     """
-    try:
-        client = get_client()
-        result = client.add_url_source(notebook_id, url=url)
+    client = await _call(get_client)
+    result = await _call(client.add_url_source, notebook_id, url=url)
+    _invalidate_notebook(notebook_id)
 
-        if result:
-            return {
-                "status": "success",
-                "source": result,
-            }
-        return {"status": "error", "error": "Failed to add URL source"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if result:
+        return _ok(source=result)
+    return _err("Failed to add URL source")
 
 
 @mcp.tool()
-def notebook_add_text(
+@_tool_errors
+async def notebook_add_text(
     notebook_id: str,
     text: str,
     title: str = "Pasted Text",
@@ -262,22 +589,28 @@ def notebook_add_text(
         text: Text content to add
         title: Optional title
     """
-    try:
-        client = get_client()
-        result = client.add_text_source(notebook_id, text=text, title=title)
+    client = await _call(get_client)
+    result = await _call(client.add_text_source, notebook_id, text=text, title=title)
+    _invalidate_notebook(notebook_id)
 
-        if result:
-            return {
-                "status": "success",
-                "source": result,
-            }
-        return {"status": "error", "error": "Failed to add text source"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if result:
+        return _ok(source=result)
+    return _err("Failed to add text source")
+
+
+# notebook_add_drive doc_type -> Drive MIME type
+_MIME_TYPES: Mapping[str, str] = MappingProxyType({
+    "doc": "application/vnd.google-apps.document",
+    "docs": "application/vnd.google-apps.document",
+    "slides": "application/vnd.google-apps.presentation",
+    "sheets": "application/vnd.google-apps.spreadsheet",
+    "pdf": "application/pdf",
+})
 
 
 @mcp.tool()
-def notebook_add_drive(
+@_tool_errors
+async def notebook_add_drive(
     notebook_id: str,
     document_id: str,
     title: str,
@@ -291,46 +624,33 @@ def notebook_add_drive(
         title: Display title
         doc_type: doc|slides|sheets|pdf
     """
-    try:
-        mime_types = {
-            "doc": "application/vnd.google-apps.document",
-            "docs": "application/vnd.google-apps.document",
-            "slides": "application/vnd.google-apps.presentation",
-            "sheets": "application/vnd.google-apps.spreadsheet",
-            "pdf": "application/pdf",
-        }
+    mime_type = _MIME_TYPES.get(doc_type) or _MIME_TYPES.get(doc_type.lower())
+    if not mime_type:
+        return _err(f"Unknown doc_type '{doc_type}'. Use 'doc', 'slides', 'sheets', or 'pdf'.")
 
-        mime_type = mime_types.get(doc_type.lower())
-        if not mime_type:
-            return {
-                "status": "error",
-                "error": f"Unknown doc_type '{doc_type}'. Use 'doc', 'slides', 'sheets', or 'pdf'.",
-            }
+    client = await _call(get_client)
+    result = await _call(
+        client.add_drive_source,
+        notebook_id,
+        document_id=document_id,
+        title=title,
+        mime_type=mime_type,
+    )
+    _invalidate_notebook(notebook_id)
 
-        client = get_client()
-        result = client.add_drive_source(
-            notebook_id,
-            document_id=document_id,
-            title=title,
-            mime_type=mime_type,
-        )
-
-        if result:
-            return {
-                "status": "success",
-                "source": result,
-            }
-        return {"status": "error", "error": "Failed to add Drive source"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if result:
+        return _ok(source=result)
+    return _err("Failed to add Drive source")
 
 
 @mcp.tool()
-def notebook_query(
+@_tool_errors
+async def notebook_query(
     notebook_id: str,
     query: str,
     source_ids: list[str] | None = None,
     conversation_id: str | None = None,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Ask AI about EXISTING sources already in notebook. NOT for finding new sources.
 
@@ -342,28 +662,74 @@ def notebook_query(
         source_ids: Source IDs to query (default: all)
         conversation_id: For follow-up questions
     """
-    try:
-        client = get_client()
-        result = client.query(
-            notebook_id,
-            query_text=query,
-            source_ids=source_ids,
-            conversation_id=conversation_id,
+    # Identical new questions (e.g. a retry) within a minute reuse the
+    # answer instead of spending query quota. Follow-ups depend on the
+    # conversation so far and are never cached
+    cache_key = None
+    if conversation_id is None:
+        # None (all sources) and [] (no sources) are different queries
+        sources_key = "*" if source_ids is None else ",".join(sorted(source_ids))
+        cache_key = hashlib.blake2b(
+            "|".join((notebook_id, query, sources_key)).encode(),
+            digest_size=16,
+        ).hexdigest()
+        result = _query_cache.get(cache_key)
+        if result is not None:
+            return _ok(
+                answer=result.get("answer", ""),
+                conversation_id=result.get("conversation_id"),
+            )
+
+    # Stream the answer as it's generated: the text added by each longer
+    # partial answer goes out as a progress notification, with the answer
+    # length so far as progress (sent only if the client asked for progress)
+    on_answer = None
+    reports: list[concurrent.futures.Future] = []
+    if ctx is not None:
+        loop = asyncio.get_running_loop()
+        sent = ""
+
+        def report_answer(text: str) -> None:
+            # Called from the worker thread running client.query
+            nonlocal sent
+            delta = text[len(sent):] if text.startswith(sent) else text
+            sent = text
+            reports.append(
+                asyncio.run_coroutine_threadsafe(
+                    ctx.report_progress(len(text), message=delta), loop
+                )
+            )
+
+        on_answer = report_answer
+
+    client = await _call(get_client)
+    result = await _call(
+        client.query,
+        notebook_id,
+        query_text=query,
+        source_ids=source_ids,
+        conversation_id=conversation_id,
+        on_answer=on_answer,
+    )
+    # Let every notification go out before the result. Progress is
+    # best-effort: a failed send must not cost an answer already paid for
+    await asyncio.gather(
+        *(asyncio.wrap_future(report) for report in reports), return_exceptions=True
+    )
+    if result and cache_key:
+        _query_cache.set(cache_key, result)
+
+    if result:
+        return _ok(
+            answer=result.get("answer", ""),
+            conversation_id=result.get("conversation_id"),
         )
-
-        if result:
-            return {
-                "status": "success",
-                "answer": result.get("answer", ""),
-                "conversation_id": result.get("conversation_id"),
-            }
-        return {"status": "error", "error": "Failed to query notebook"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _err("Failed to query notebook")
 
 
 @mcp.tool()
-def notebook_delete(
+@_tool_errors
+async def notebook_delete(
     notebook_id: str,
     confirm: bool = False,
 ) -> dict[str, Any]:
@@ -374,30 +740,25 @@ def notebook_delete(
         confirm: Must be True after user approval
     """
     if not confirm:
-        return {
-            "status": "error",
-            "error": "Deletion not confirmed. You must ask the user to confirm "
-                     "before deleting. Set confirm=True only after user approval.",
-            "warning": "This action is IRREVERSIBLE. The notebook and all its "
-                       "sources will be permanently deleted.",
-        }
+        return _err(
+            "Deletion not confirmed. You must ask the user to confirm "
+            "before deleting. Set confirm=True only after user approval.",
+            warning="This action is IRREVERSIBLE. The notebook and all its "
+                    "sources will be permanently deleted.",
+        )
 
-    try:
-        client = get_client()
-        result = client.delete_notebook(notebook_id)
+    client = await _call(get_client)
+    result = await _call(client.delete_notebook, notebook_id)
+    _invalidate_notebook(notebook_id)
 
-        if result:
-            return {
-                "status": "success",
-                "message": f"Notebook {notebook_id} has been permanently deleted.",
-            }
-        return {"status": "error", "error": "Failed to delete notebook"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if result:
+        return _ok(message=f"Notebook {notebook_id} has been permanently deleted.")
+    return _err("Failed to delete notebook")
 
 
 @mcp.tool()
-def notebook_rename(
+@_tool_errors
+async def notebook_rename(
     notebook_id: str,
     new_title: str,
 ) -> dict[str, Any]:
@@ -407,25 +768,23 @@ def notebook_rename(
         notebook_id: Notebook UUID
         new_title: New title
     """
-    try:
-        client = get_client()
-        result = client.rename_notebook(notebook_id, new_title)
-
-        if result:
-            return {
-                "status": "success",
-                "notebook": {
-                    "id": notebook_id,
-                    "title": new_title,
-                },
-            }
-        return {"status": "error", "error": "Failed to rename notebook"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    client = await _call(get_client)
+    result = await _call(client.rename_notebook, notebook_id, new_title)
+    _invalidate_notebook(notebook_id)
+
+    if result:
+        return _ok(
+            notebook={
+                "id": notebook_id,
+                "title": new_title,
+            },
+        )
+    return _err("Failed to rename notebook")
 
 
 @mcp.tool()
-def chat_configure(
+@_tool_errors
+async def chat_configure(
     notebook_id: str,
     goal: str = "default",
     custom_prompt: str | None = None,
@@ -439,23 +798,22 @@ def chat_configure(
         custom_prompt: Required when goal=custom (max 10000 chars)
         response_length: default|longer|shorter
     """
-    try:
-        client = get_client()
-        result = client.configure_chat(
-            notebook_id=notebook_id,
-            goal=goal,
-            custom_prompt=custom_prompt,
-            response_length=response_length,
-        )
-        return result
-    except ValueError as e:
-        return {"status": "error", "error": str(e)}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    client = await _call(get_client)
+    result = await _call(
+        client.configure_chat,
+        notebook_id=notebook_id,
+        goal=goal,
+        custom_prompt=custom_prompt,
+        response_length=response_length,
+    )
+    # Chat settings shape answers - don't serve ones given under the old settings
+    _query_cache.clear()
+    return result
 
 
 @mcp.tool()
-def source_list_drive(notebook_id: str) -> dict[str, Any]:
+@_tool_errors
+async def source_list_drive(notebook_id: str) -> dict[str, Any]:
     """List sources with types and Drive freshness status.
 
     Use before source_sync_drive to identify stale sources.
@@ -463,48 +821,49 @@ def source_list_drive(notebook_id: str) -> dict[str, Any]:
     Args:
         notebook_id: Notebook UUID
     """
-    try:
-        client = get_client()
-        sources = client.get_notebook_sources_with_types(notebook_id)
-
-        # Separate sources by syncability
-        syncable_sources = []
-        other_sources = []
-
-        for src in sources:
-            if src.get("can_sync"):
-                # Check freshness for syncable sources (Drive docs and Gemini Notes)
-                is_fresh = client.check_source_freshness(src["id"])
-                src["is_fresh"] = is_fresh
-                src["needs_sync"] = is_fresh is False
-                syncable_sources.append(src)
-            else:
-                other_sources.append(src)
+    client = await _call(get_client)
+    sources = await _get_sources_with_types(client, notebook_id)
 
-        # Count stale sources
-        stale_count = sum(1 for s in syncable_sources if s.get("needs_sync"))
+    # Separate sources by syncability
+    syncable_sources = []
+    other_sources = []
 
-        return {
-            "status": "success",
-            "notebook_id": notebook_id,
-            "summary": {
-                "total_sources": len(sources),
-                "syncable_sources": len(syncable_sources),
-                "stale_sources": stale_count,
-                "other_sources": len(other_sources),
-            },
-            "syncable_sources": syncable_sources,
-            "other_sources": [
-                {"id": s["id"], "title": s["title"], "type": s["source_type_name"]}
-                for s in other_sources
-            ],
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    for src in sources:
+        if src.get("can_sync"):
+            syncable_sources.append(src)
+        else:
+            other_sources.append(src)
+
+    # Check freshness for syncable sources (Drive docs and Gemini Notes)
+    # with one batched request
+    freshness = await _check_freshness_many(client, [src["id"] for src in syncable_sources])
+    stale_count = 0
+    for src in syncable_sources:
+        is_fresh = freshness.get(src["id"])
+        src["is_fresh"] = is_fresh
+        src["needs_sync"] = is_fresh is False
+        if is_fresh is False:
+            stale_count += 1
+
+    return _ok(
+        notebook_id=notebook_id,
+        summary={
+            "total_sources": len(sources),
+            "syncable_sources": len(syncable_sources),
+            "stale_sources": stale_count,
+            "other_sources": len(other_sources),
+        },
+        syncable_sources=syncable_sources,
+        other_sources=[
+            {"id": s["id"], "title": s["title"], "type": s["source_type_name"]}
+            for s in other_sources
+        ],
+    )
 
 
 @mcp.tool()
-def source_sync_drive(
+@_tool_errors
+async def source_sync_drive(
     source_ids: list[str],
     confirm: bool = False,
 ) -> dict[str, Any]:
@@ -517,66 +876,83 @@ def source_sync_drive(
         confirm: Must be True after user approval
     """
     if not confirm:
-        return {
-            "status": "error",
-            "error": "Sync not confirmed. You must ask the user to confirm "
-                     "before syncing. Set confirm=True only after user approval.",
-            "hint": "First call source_list_drive to show stale sources, "
-                    "then ask user to confirm before syncing.",
-        }
+        return _err(
+            "Sync not confirmed. You must ask the user to confirm "
+            "before syncing. Set confirm=True only after user approval.",
+            hint="First call source_list_drive to show stale sources, "
+                 "then ask user to confirm before syncing.",
+        )
 
     if not source_ids:
-        return {
-            "status": "error",
-            "error": "No source_ids provided. Use source_list_drive to get source IDs.",
-        }
-
-    try:
-        client = get_client()
-        results = []
-        synced_count = 0
-        failed_count = 0
-
-        for source_id in source_ids:
-            try:
-                result = client.sync_drive_source(source_id)
-                if result:
-                    results.append({
-                        "source_id": source_id,
-                        "status": "synced",
-                        "title": result.get("title"),
-                    })
-                    synced_count += 1
-                else:
-                    results.append({
-                        "source_id": source_id,
-                        "status": "failed",
-                        "error": "Sync returned no result",
-                    })
-                    failed_count += 1
-            except Exception as e:
-                results.append({
-                    "source_id": source_id,
-                    "status": "failed",
-                    "error": str(e),
-                })
-                failed_count += 1
-
-        return {
-            "status": "success" if failed_count == 0 else "partial",
-            "summary": {
-                "total": len(source_ids),
-                "synced": synced_count,
-                "failed": failed_count,
-            },
-            "results": results,
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return _err("No source_ids provided. Use source_list_drive to get source IDs.")
+
+    client = await _call(get_client)
+    results = []
+    synced_count = 0
+    failed_count = 0
+
+    # Sync in parallel, a bounded number at a time
+    semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+    async def sync_one(source_id: str) -> dict | None:
+        async with semaphore:
+            for attempt in range(1, SYNC_ATTEMPTS + 1):
+                try:
+                    return await _call(client.sync_drive_source, source_id)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 429 or attempt == SYNC_ATTEMPTS:
+                        raise
+                # Rate limited - back off 1s, 2s, ... with jitter
+                delay = 2 ** (attempt - 1)
+                await asyncio.sleep(delay + random.uniform(0, 0.2 * delay))
+
+    outcomes = await asyncio.gather(
+        *(sync_one(source_id) for source_id in source_ids), return_exceptions=True
+    )
+
+    # Synced content changes freshness - don't serve stale cache entries.
+    # The owning notebooks aren't known here, so drop all cached notebook data
+    for source_id in source_ids:
+        _freshness_cache.pop(source_id)
+    _invalidate_notebook()
+
+    for source_id, result in zip(source_ids, outcomes):
+        if isinstance(result, Exception):
+            results.append({
+                "source_id": source_id,
+                "status": "failed",
+                "error": str(result),
+            })
+            failed_count += 1
+        elif result:
+            results.append({
+                "source_id": source_id,
+                "status": "synced",
+                "title": result.get("title"),
+            })
+            synced_count += 1
+        else:
+            results.append({
+                "source_id": source_id,
+                "status": "failed",
+                "error": "Sync returned no result",
+            })
+            failed_count += 1
+
+    return {
+        "status": "success" if failed_count == 0 else "partial",
+        "summary": {
+            "total": len(source_ids),
+            "synced": synced_count,
+            "failed": failed_count,
+        },
+        "results": results,
+    }
 
 
 @mcp.tool()
-def source_delete(
+@_tool_errors
+async def source_delete(
     source_id: str,
     confirm: bool = False,
 ) -> dict[str, Any]:
@@ -587,30 +963,27 @@ def source_delete(
         confirm: Must be True after user approval
     """
     if not confirm:
-        return {
-            "status": "error",
-            "error": "Deletion not confirmed. You must ask the user to confirm "
-                     "before deleting. Set confirm=True only after user approval.",
-            "warning": "This action is IRREVERSIBLE. The source will be "
-                       "permanently deleted from the notebook.",
-        }
+        return _err(
+            "Deletion not confirmed. You must ask the user to confirm "
+            "before deleting. Set confirm=True only after user approval.",
+            warning="This action is IRREVERSIBLE. The source will be "
+                    "permanently deleted from the notebook.",
+        )
 
-    try:
-        client = get_client()
-        result = client.delete_source(source_id)
+    client = await _call(get_client)
+    result = await _call(client.delete_source, source_id)
+    # The owning notebook isn't known here, so drop all cached notebook data
+    _invalidate_notebook()
+    _freshness_cache.pop(source_id)
 
-        if result:
-            return {
-                "status": "success",
-                "message": f"Source {source_id} has been permanently deleted.",
-            }
-        return {"status": "error", "error": "Failed to delete source"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if result:
+        return _ok(message=f"Source {source_id} has been permanently deleted.")
+    return _err("Failed to delete source")
 
 
 @mcp.tool()
-def research_start(
+@_tool_errors
+async def research_start(
     query: str,
     source: str = "web",
     mode: str = "fast",
@@ -629,66 +1002,60 @@ def research_start(
         notebook_id: Existing notebook (creates new if not provided)
         title: Title for new notebook
     """
-    try:
-        client = get_client()
-
-        # Validate mode + source combination early
-        if mode.lower() == "deep" and source.lower() == "drive":
-            return {
-                "status": "error",
-                "error": "Deep Research only supports Web sources. Use mode='fast' for Drive.",
-            }
-
-        # Create notebook if needed
-        if not notebook_id:
-            notebook_title = title or f"Research: {query[:50]}"
-            notebook = client.create_notebook(title=notebook_title)
-            if not notebook:
-                return {"status": "error", "error": "Failed to create notebook"}
-            notebook_id = notebook.id
-            created_notebook = True
-        else:
-            created_notebook = False
-
-        # Start research
-        result = client.start_research(
+    # Validate mode + source combination early
+    if mode.lower() == "deep" and source.lower() == "drive":
+        return _err("Deep Research only supports Web sources. Use mode='fast' for Drive.")
+
+    client = await _call(get_client)
+
+    # Create notebook if needed
+    if not notebook_id:
+        notebook_title = title or f"Research: {query[:50]}"
+        notebook = await _call(client.create_notebook, title=notebook_title)
+        if not notebook:
+            return _err("Failed to create notebook")
+        notebook_id = notebook.id
+        created_notebook = True
+        _notebooks_cache.clear()
+    else:
+        created_notebook = False
+
+    # Start research
+    result = await _call(
+        client.start_research,
+        notebook_id=notebook_id,
+        query=query,
+        source=source,
+        mode=mode,
+    )
+    _research_cache.pop(notebook_id)
+
+    if result:
+        response = _ok(
+            task_id=result["task_id"],
             notebook_id=notebook_id,
+            notebook_url=_NB_URL_PREFIX + notebook_id,
             query=query,
-            source=source,
-            mode=mode,
+            source=result["source"],
+            mode=result["mode"],
+            created_notebook=created_notebook,
         )
 
-        if result:
-            response = {
-                "status": "success",
-                "task_id": result["task_id"],
-                "notebook_id": notebook_id,
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-                "query": query,
-                "source": result["source"],
-                "mode": result["mode"],
-                "created_notebook": created_notebook,
-            }
-
-            # Add helpful message based on mode
-            if result["mode"] == "deep":
-                response["message"] = (
-                    "Deep Research started. This takes 3-5 minutes. "
-                    "Call research_status to check progress."
-                )
-            else:
-                response["message"] = (
-                    "Fast Research started. This takes about 30 seconds. "
-                    "Call research_status to check progress."
-                )
+        # Add helpful message based on mode
+        if result["mode"] == "deep":
+            response["message"] = (
+                "Deep Research started. This takes 3-5 minutes. "
+                "Call research_status to check progress."
+            )
+        else:
+            response["message"] = (
+                "Fast Research started. This takes about 30 seconds. "
+                "Call research_status to check progress."
+            )
 
-            return response
+        return response
 
-        return {"status": "error", "error": "Failed to start research"}
-    except ValueError as e:
-        return {"status": "error", "error": str(e)}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _err("Failed to start research")
 
 
 def _compact_research_result(result: dict) -> dict:
@@ -717,7 +1084,8 @@ def _compact_research_result(result: dict) -> dict:
 
 
 @mcp.tool()
-def research_status(
+@_tool_errors
+async def research_status(
     notebook_id: str,
     poll_interval: int = 30,
     max_wait: int = 300,
@@ -727,177 +1095,388 @@ def research_status(
 
     Args:
         notebook_id: Notebook UUID
-        poll_interval: Seconds between polls (default: 30)
+        poll_interval: Max seconds between polls (default: 30). Polls start at 2s and back off.
         max_wait: Max seconds to wait (default: 300, 0=single poll)
         compact: If True (default), truncate report and limit sources shown to save tokens.
                 Use compact=False to get full details.
+
+    Returns: research.sources can be passed to research_import as sources_snapshot
     """
-    import time
+    client = await _call(get_client)
+    start_time = time.time()
+    polls = 0
 
-    try:
-        client = get_client()
-        start_time = time.time()
-        polls = 0
-
-        while True:
-            polls += 1
-            result = client.poll_research(notebook_id)
-
-            if not result:
-                return {"status": "error", "error": "Failed to poll research status"}
-
-            # If completed or no research found, return immediately
-            if result.get("status") in ("completed", "no_research"):
-                result["polls_made"] = polls
-                result["wait_time_seconds"] = round(time.time() - start_time, 1)
-
-                # Compact mode: truncate to save tokens
-                if compact and result.get("status") == "completed":
-                    result = _compact_research_result(result)
-
-                return {
-                    "status": "success",
-                    "research": result,
-                }
-
-            # Check if we should stop waiting
-            elapsed = time.time() - start_time
-            if max_wait == 0 or elapsed >= max_wait:
-                result["polls_made"] = polls
-                result["wait_time_seconds"] = round(elapsed, 1)
-                result["message"] = (
-                    f"Research still in progress after {round(elapsed, 1)}s. "
-                    f"Call research_status again to continue waiting."
-                )
+    while True:
+        polls += 1
+        result = await _call(client.poll_research, notebook_id)
+
+        if not result:
+            return _err("Failed to poll research status")
+
+        # Completed research is final - keep it for a following research_import
+        # (a copy, since the result is annotated and compacted below)
+        if result.get("status") == "completed":
+            _research_cache.set(notebook_id, dict(result))
+
+        # If completed or no research found, return immediately
+        if result.get("status") in ("completed", "no_research"):
+            result["polls_made"] = polls
+            result["wait_time_seconds"] = round(time.time() - start_time, 1)
+
+            # Compact mode: truncate to save tokens
+            if compact and result.get("status") == "completed":
+                result = _compact_research_result(result)
 
-                # Compact mode even for in-progress
-                if compact:
-                    result = _compact_research_result(result)
+            return _ok(research=result)
 
-                return {
-                    "status": "success",
-                    "research": result,
-                }
+        # Check if we should stop waiting
+        elapsed = time.time() - start_time
+        if max_wait == 0 or elapsed >= max_wait:
+            result["polls_made"] = polls
+            result["wait_time_seconds"] = round(elapsed, 1)
+            result["message"] = (
+                f"Research still in progress after {round(elapsed, 1)}s. "
+                f"Call research_status again to continue waiting."
+            )
 
-            # Wait before next poll
-            time.sleep(poll_interval)
+            # Compact mode even for in-progress
+            if compact:
+                result = _compact_research_result(result)
 
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+            return _ok(research=result)
+
+        # Back off before the next poll: 2s, 3.4s, 5.8s, ... capped at
+        # poll_interval, with jitter so concurrent pollers don't line up
+        delay = min(RESEARCH_POLL_INITIAL * (1.7 ** (polls - 1)), poll_interval)
+        delay += random.uniform(0, 0.2 * delay)
+        await asyncio.sleep(min(delay, max_wait - elapsed))
 
 
 @mcp.tool()
-def research_import(
+@_tool_errors
+async def research_import(
     notebook_id: str,
     task_id: str,
     source_indices: list[int] | None = None,
+    sources_snapshot: list[dict] | None = None,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Import discovered sources into notebook.
 
     Call after research_status shows status="completed".
+    Reports progress as each batch of sources is imported. If some batches
+    fail, status is "partial" and errors lists their sources.
 
     Args:
         notebook_id: Notebook UUID
         task_id: Research task ID
         source_indices: Source indices to import (default: all)
+        sources_snapshot: research.sources from research_status (compact=False), passed
+                          verbatim to skip re-fetching research results
     """
-    try:
-        client = get_client()
-
-        # First, get the current research results to get source details
-        poll_result = client.poll_research(notebook_id)
-
-        if not poll_result or poll_result.get("status") == "no_research":
-            return {
-                "status": "error",
-                "error": "No research found for this notebook. Run research_start first.",
-            }
-
-        if poll_result.get("status") != "completed":
-            return {
-                "status": "error",
-                "error": f"Research is still in progress (status: {poll_result.get('status')}). "
-                         "Wait for completion before importing.",
-            }
-
-        # Get sources from poll result
-        all_sources = poll_result.get("sources", [])
-        report_content = poll_result.get("report", "")
-
-        if not all_sources:
-            return {
-                "status": "error",
-                "error": "No sources found in research results.",
-            }
-
-        # Separate deep_report sources (type 5) from importable web/drive sources
-        # Deep reports will be imported as text sources, web sources imported normally
-        deep_report_source = None
-        web_sources = []
-
-        for src in all_sources:
-            if src.get("result_type") == 5:
-                deep_report_source = src
-            else:
-                web_sources.append(src)
-
-        # Filter sources by indices if specified
-        if source_indices is not None:
-            sources_to_import = []
-            invalid_indices = []
-            for idx in source_indices:
-                if 0 <= idx < len(all_sources):
-                    sources_to_import.append(all_sources[idx])
-                else:
-                    invalid_indices.append(idx)
-
-            if invalid_indices:
-                return {
-                    "status": "error",
-                    "error": f"Invalid source indices: {invalid_indices}. "
-                             f"Valid range is 0-{len(all_sources)-1}.",
-                }
+    client = await _call(get_client)
+
+    # First, get the research results to get source details: from the
+    # caller's snapshot, or a research_status call made just before.
+    # A deep research report's text isn't in the snapshot, so poll for it
+    if sources_snapshot and not any(s.get("result_type") == 5 for s in sources_snapshot):
+        poll_result = {"status": "completed", "sources": sources_snapshot}
+    else:
+        poll_result = _research_cache.get(notebook_id)
+        if poll_result is None:
+            poll_result = await _call(client.poll_research, notebook_id)
+
+    if not poll_result or poll_result.get("status") == "no_research":
+        return _err("No research found for this notebook. Run research_start first.")
+
+    if poll_result.get("status") != "completed":
+        return _err(f"Research is still in progress (status: {poll_result.get('status')}). "
+                    "Wait for completion before importing.")
+
+    # Get sources from poll result
+    all_sources = poll_result.get("sources", [])
+    report_content = poll_result.get("report", "")
+
+    if not all_sources:
+        return _err("No sources found in research results.")
+
+    # Separate deep_report sources (type 5) from importable web/drive sources
+    # Deep reports will be imported as text sources, web sources imported normally
+    deep_report_source = None
+    web_sources = []
+
+    for src in all_sources:
+        if src.get("result_type") == 5:
+            deep_report_source = src
         else:
-            sources_to_import = all_sources
-
-        # Import web/drive sources (skip deep_report sources as they don't have URLs)
-        web_sources_to_import = [s for s in sources_to_import if s.get("result_type") != 5]
-        imported = client.import_research_sources(
+            web_sources.append(src)
+
+    # Filter sources by indices if specified
+    if source_indices is not None:
+        sources_to_import = []
+        invalid_indices = []
+        for idx in source_indices:
+            if 0 <= idx < len(all_sources):
+                sources_to_import.append(all_sources[idx])
+            else:
+                invalid_indices.append(idx)
+
+        if invalid_indices:
+            return _err(f"Invalid source indices: {invalid_indices}. "
+                        f"Valid range is 0-{len(all_sources)-1}.")
+    else:
+        sources_to_import = all_sources
+
+    # Import web/drive sources (skip deep_report sources as they don't have URLs)
+    web_sources_to_import = [s for s in sources_to_import if s.get("result_type") != 5]
+
+    # Import in parallel batches, reporting progress as each one lands
+    batches = [
+        web_sources_to_import[i:i + RESEARCH_IMPORT_BATCH]
+        for i in range(0, len(web_sources_to_import), RESEARCH_IMPORT_BATCH)
+    ]
+    done = 0
+
+    async def import_batch(batch: list[dict]) -> list[dict]:
+        nonlocal done
+        result = await _call(
+            client.import_research_sources,
             notebook_id=notebook_id,
             task_id=task_id,
-            sources=web_sources_to_import,
+            sources=batch,
         )
-
-        # If deep research with report, import the report as a text source
-        if deep_report_source and report_content:
+        done += len(batch)
+        if ctx is not None:
+            # Best-effort: the sources are in the notebook either way, and a
+            # batch reported as failed would be imported twice on retry
             try:
-                report_result = client.add_text_source(
-                    notebook_id=notebook_id,
-                    title=deep_report_source.get("title", "Deep Research Report"),
-                    text=report_content,
-                )
-                if report_result:
-                    imported.append({
-                        "id": report_result.get("id"),
-                        "title": report_result.get("title", "Deep Research Report"),
-                    })
-            except Exception as e:
-                # Don't fail the entire import if report import fails
+                await ctx.report_progress(done, len(web_sources_to_import))
+            except Exception:
                 pass
+        return result
+
+    try:
+        batch_results = await asyncio.gather(
+            *(import_batch(batch) for batch in batches), return_exceptions=True
+        )
+    finally:
+        _invalidate_notebook(notebook_id)
+        _research_cache.pop(notebook_id)
+
+    # A failed batch doesn't undo the others - keep what was imported
+    imported = []
+    errors = []
+    for batch, result in zip(batches, batch_results):
+        if isinstance(result, Exception):
+            errors.append({
+                "titles": [src.get("title", "") for src in batch],
+                "error": str(result),
+            })
+        else:
+            imported.extend(result)
+
+    # If deep research with report, import the report as a text source
+    if deep_report_source and report_content:
+        try:
+            report_result = await _call(
+                client.add_text_source,
+                notebook_id=notebook_id,
+                title=deep_report_source.get("title", "Deep Research Report"),
+                text=report_content,
+            )
+            if report_result:
+                imported.append({
+                    "id": report_result.get("id"),
+                    "title": report_result.get("title", "Deep Research Report"),
+                })
+        except Exception as e:
+            # Don't fail the entire import if report import fails
+            pass
+
+    if errors and not imported:
+        return _err(errors[0]["error"], errors=errors)
+
+    response = _ok(
+        imported_count=len(imported),
+        total_available=len(all_sources),
+        sources=imported,
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
+    if errors:
+        response["status"] = "partial"
+        response["errors"] = errors
+    return response
+
+
+# Studio option name -> API code tables, with their unknown-option error messages
+_AUDIO_FORMAT_CODES = MappingProxyType({"deep_dive": 1, "brief": 2, "critique": 3, "debate": 4})
+_AUDIO_FORMAT_ERR = "Unknown format '%s'. Use: " + ", ".join(_AUDIO_FORMAT_CODES) + "."
+
+_AUDIO_LENGTH_CODES = MappingProxyType({"short": 1, "default": 2, "long": 3})
+_AUDIO_LENGTH_ERR = "Unknown length '%s'. Use: " + ", ".join(_AUDIO_LENGTH_CODES) + "."
+
+_VIDEO_FORMAT_CODES = MappingProxyType({"explainer": 1, "brief": 2})
+_VIDEO_FORMAT_ERR = "Unknown format '%s'. Use: " + ", ".join(_VIDEO_FORMAT_CODES) + "."
+
+_VIDEO_STYLE_CODES = MappingProxyType({
+    "auto_select": 1,
+    "custom": 2,
+    "classic": 3,
+    "whiteboard": 4,
+    "kawaii": 5,
+    "anime": 6,
+    "watercolor": 7,
+    "retro_print": 8,
+    "heritage": 9,
+    "paper_craft": 10,
+})
+_VIDEO_STYLE_ERR = "Unknown visual_style '%s'. Use: " + ", ".join(_VIDEO_STYLE_CODES) + "."
+
+_ORIENTATION_CODES = MappingProxyType({"landscape": 1, "portrait": 2, "square": 3})
+_ORIENTATION_ERR = "Unknown orientation '%s'. Use: " + ", ".join(_ORIENTATION_CODES) + "."
+
+_DETAIL_CODES = MappingProxyType({"concise": 1, "standard": 2, "detailed": 3})
+_DETAIL_ERR = "Unknown detail_level '%s'. Use: " + ", ".join(_DETAIL_CODES) + "."
+
+_SLIDE_FORMAT_CODES = MappingProxyType({"detailed_deck": 1, "presenter_slides": 2})
+_SLIDE_FORMAT_ERR = "Unknown format '%s'. Use: " + ", ".join(_SLIDE_FORMAT_CODES) + "."
+
+_SLIDE_LENGTH_CODES = MappingProxyType({"short": 1, "default": 3})
+_SLIDE_LENGTH_ERR = "Unknown length '%s'. Use: " + ", ".join(_SLIDE_LENGTH_CODES) + "."
+
+
+@dataclass(frozen=True)
+class _ArtifactSpec:
+    """How a studio create tool maps its options and reports its result."""
+    label: str  # e.g. "audio overview", used in messages
+    type: str  # "type" field of the success response
+    started: str  # subject of the "... generation started" message
+    client_method: str  # NotebookLMClient method that starts generation
+    options: tuple[tuple[str, str, Mapping[str, int], str], ...]  # (param, client kwarg, codes, error)
+    result_fields: tuple[str, ...]  # fields copied from the client result
+
+
+_ARTIFACT_SPECS: dict[str, _ArtifactSpec] = {
+    "audio": _ArtifactSpec(
+        label="audio overview",
+        type="audio",
+        started="Audio",
+        client_method="create_audio_overview",
+        options=(
+            ("format", "format_code", _AUDIO_FORMAT_CODES, _AUDIO_FORMAT_ERR),
+            ("length", "length_code", _AUDIO_LENGTH_CODES, _AUDIO_LENGTH_ERR),
+        ),
+        result_fields=("format", "length", "language"),
+    ),
+    "video": _ArtifactSpec(
+        label="video overview",
+        type="video",
+        started="Video",
+        client_method="create_video_overview",
+        options=(
+            ("format", "format_code", _VIDEO_FORMAT_CODES, _VIDEO_FORMAT_ERR),
+            ("visual_style", "visual_style_code", _VIDEO_STYLE_CODES, _VIDEO_STYLE_ERR),
+        ),
+        result_fields=("format", "visual_style", "language"),
+    ),
+    "infographic": _ArtifactSpec(
+        label="infographic",
+        type="infographic",
+        started="Infographic",
+        client_method="create_infographic",
+        options=(
+            ("orientation", "orientation_code", _ORIENTATION_CODES, _ORIENTATION_ERR),
+            ("detail_level", "detail_level_code", _DETAIL_CODES, _DETAIL_ERR),
+        ),
+        result_fields=("orientation", "detail_level", "language"),
+    ),
+    "slide_deck": _ArtifactSpec(
+        label="slide deck",
+        type="slide_deck",
+        started="Slide deck",
+        client_method="create_slide_deck",
+        options=(
+            ("format", "format_code", _SLIDE_FORMAT_CODES, _SLIDE_FORMAT_ERR),
+            ("length", "length_code", _SLIDE_LENGTH_CODES, _SLIDE_LENGTH_ERR),
+        ),
+        result_fields=("format", "length", "language"),
+    ),
+}
+
+
+async def _create_artifact(
+    kind: str,
+    notebook_id: str,
+    source_ids: list[str] | None,
+    language: str,
+    focus_prompt: str,
+    confirm: bool,
+    **options: str,
+) -> dict[str, Any]:
+    """Shared body of the audio/video/infographic/slide deck create tools.
+
+    options are the tool's option strings (e.g. format="brief"), mapped to
+    API codes through the kind's _ArtifactSpec.
+    """
+    spec = _ARTIFACT_SPECS[kind]
 
+    if not confirm:
         return {
-            "status": "success",
-            "imported_count": len(imported),
-            "total_available": len(all_sources),
-            "sources": imported,
-            "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
+            "status": "pending_confirmation",
+            "message": f"Please confirm these settings before creating the {spec.label}:",
+            "settings": {
+                "notebook_id": notebook_id,
+                **options,
+                "language": language,
+                "focus_prompt": focus_prompt or "(none)",
+                "source_ids": source_ids or "all sources",
+            },
+            "note": "Set confirm=True after user approves these settings.",
         }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+
+    # Map option strings to codes; canonical lowercase input skips .lower()
+    codes = {}
+    for param, kwarg, table, error in spec.options:
+        value = options[param]
+        code = table.get(value)
+        if code is None:
+            code = table.get(value.lower())
+        if code is None:
+            return _err(error % value)
+        codes[kwarg] = code
+
+    client = await _call(get_client)
+
+    # Get source IDs if not provided
+    if source_ids is None:
+        source_ids = await _default_source_ids(client, notebook_id)
+
+    if not source_ids:
+        return _err(f"No sources found in notebook. Add sources before creating {spec.label}.")
+
+    result = await _call(
+        getattr(client, spec.client_method),
+        notebook_id=notebook_id,
+        source_ids=source_ids,
+        language=language,
+        focus_prompt=focus_prompt,
+        **codes,
+    )
+
+    return _ok(
+        artifact_id=result["artifact_id"],
+        type=spec.type,
+        **{field: result[field] for field in spec.result_fields},
+        generation_status=result["status"],
+        message=f"{spec.started} generation started. "
+                "Use studio_status to check progress.",
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
 
 
 @mcp.tool()
-def audio_overview_create(
+@_tool_errors
+async def audio_overview_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     format: str = "deep_dive",
@@ -917,90 +1496,15 @@ def audio_overview_create(
         focus_prompt: Optional focus text
         confirm: Must be True after user approval
     """
-    if not confirm:
-        return {
-            "status": "pending_confirmation",
-            "message": "Please confirm these settings before creating the audio overview:",
-            "settings": {
-                "notebook_id": notebook_id,
-                "format": format,
-                "length": length,
-                "language": language,
-                "focus_prompt": focus_prompt or "(none)",
-                "source_ids": source_ids or "all sources",
-            },
-            "note": "Set confirm=True after user approves these settings.",
-        }
-
-    try:
-        client = get_client()
-
-        # Map format string to code
-        format_codes = {
-            "deep_dive": 1,
-            "brief": 2,
-            "critique": 3,
-            "debate": 4,
-        }
-        format_code = format_codes.get(format.lower())
-        if format_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown format '{format}'. Use: deep_dive, brief, critique, or debate.",
-            }
-
-        # Map length string to code
-        length_codes = {
-            "short": 1,
-            "default": 2,
-            "long": 3,
-        }
-        length_code = length_codes.get(length.lower())
-        if length_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown length '{length}'. Use: short, default, or long.",
-            }
-
-        # Get source IDs if not provided
-        if source_ids is None:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s["id"]]
-
-        if not source_ids:
-            return {
-                "status": "error",
-                "error": "No sources found in notebook. Add sources before creating audio overview.",
-            }
-
-        result = client.create_audio_overview(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            format_code=format_code,
-            length_code=length_code,
-            language=language,
-            focus_prompt=focus_prompt,
-        )
-
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "audio",
-                "format": result["format"],
-                "length": result["length"],
-                "language": result["language"],
-                "generation_status": result["status"],
-                "message": "Audio generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create audio overview"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return await _create_artifact(
+        "audio", notebook_id, source_ids, language, focus_prompt, confirm,
+        format=format, length=length,
+    )
 
 
 @mcp.tool()
-def video_overview_create(
+@_tool_errors
+async def video_overview_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     format: str = "explainer",
@@ -1020,126 +1524,42 @@ def video_overview_create(
         focus_prompt: Optional focus text
         confirm: Must be True after user approval
     """
-    if not confirm:
-        return {
-            "status": "pending_confirmation",
-            "message": "Please confirm these settings before creating the video overview:",
-            "settings": {
-                "notebook_id": notebook_id,
-                "format": format,
-                "visual_style": visual_style,
-                "language": language,
-                "focus_prompt": focus_prompt or "(none)",
-                "source_ids": source_ids or "all sources",
-            },
-            "note": "Set confirm=True after user approves these settings.",
-        }
-
-    try:
-        client = get_client()
-
-        # Map format string to code
-        format_codes = {
-            "explainer": 1,
-            "brief": 2,
-        }
-        format_code = format_codes.get(format.lower())
-        if format_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown format '{format}'. Use: explainer or brief.",
-            }
-
-        # Map style string to code
-        style_codes = {
-            "auto_select": 1,
-            "custom": 2,
-            "classic": 3,
-            "whiteboard": 4,
-            "kawaii": 5,
-            "anime": 6,
-            "watercolor": 7,
-            "retro_print": 8,
-            "heritage": 9,
-            "paper_craft": 10,
-        }
-        style_code = style_codes.get(visual_style.lower())
-        if style_code is None:
-            valid_styles = ", ".join(style_codes.keys())
-            return {
-                "status": "error",
-                "error": f"Unknown visual_style '{visual_style}'. Use: {valid_styles}",
-            }
-
-        # Get source IDs if not provided
-        if source_ids is None:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s["id"]]
-
-        if not source_ids:
-            return {
-                "status": "error",
-                "error": "No sources found in notebook. Add sources before creating video overview.",
-            }
-
-        result = client.create_video_overview(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            format_code=format_code,
-            visual_style_code=style_code,
-            language=language,
-            focus_prompt=focus_prompt,
-        )
-
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "video",
-                "format": result["format"],
-                "visual_style": result["visual_style"],
-                "language": result["language"],
-                "generation_status": result["status"],
-                "message": "Video generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create video overview"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return await _create_artifact(
+        "video", notebook_id, source_ids, language, focus_prompt, confirm,
+        format=format, visual_style=visual_style,
+    )
 
 
 @mcp.tool()
-def studio_status(notebook_id: str) -> dict[str, Any]:
+@_tool_errors
+async def studio_status(notebook_id: str) -> dict[str, Any]:
     """Check studio content generation status and get URLs.
 
     Args:
         notebook_id: Notebook UUID
     """
-    try:
-        client = get_client()
-        artifacts = client.poll_studio_status(notebook_id)
+    client = await _call(get_client)
+    artifacts = await _call(client.poll_studio_status, notebook_id)
 
-        # Separate by status
-        completed = [a for a in artifacts if a["status"] == "completed"]
-        in_progress = [a for a in artifacts if a["status"] == "in_progress"]
+    # Separate by status
+    completed = [a for a in artifacts if a["status"] == "completed"]
+    in_progress = [a for a in artifacts if a["status"] == "in_progress"]
 
-        return {
-            "status": "success",
-            "notebook_id": notebook_id,
-            "summary": {
-                "total": len(artifacts),
-                "completed": len(completed),
-                "in_progress": len(in_progress),
-            },
-            "artifacts": artifacts,
-            "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _ok(
+        notebook_id=notebook_id,
+        summary={
+            "total": len(artifacts),
+            "completed": len(completed),
+            "in_progress": len(in_progress),
+        },
+        artifacts=artifacts,
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
 
 
 @mcp.tool()
-def studio_delete(
+@_tool_errors
+async def studio_delete(
     notebook_id: str,
     artifact_id: str,
     confirm: bool = False,
@@ -1152,31 +1572,27 @@ def studio_delete(
         confirm: Must be True after user approval
     """
     if not confirm:
-        return {
-            "status": "error",
-            "error": "Deletion not confirmed. You must ask the user to confirm "
-                     "before deleting. Set confirm=True only after user approval.",
-            "warning": "This action is IRREVERSIBLE. The artifact will be permanently deleted.",
-            "hint": "First call studio_status to list artifacts with their IDs and titles.",
-        }
+        return _err(
+            "Deletion not confirmed. You must ask the user to confirm "
+            "before deleting. Set confirm=True only after user approval.",
+            warning="This action is IRREVERSIBLE. The artifact will be permanently deleted.",
+            hint="First call studio_status to list artifacts with their IDs and titles.",
+        )
 
-    try:
-        client = get_client()
-        result = client.delete_studio_artifact(artifact_id)
+    client = await _call(get_client)
+    result = await _call(client.delete_studio_artifact, artifact_id)
 
-        if result:
-            return {
-                "status": "success",
-                "message": f"Artifact {artifact_id} has been permanently deleted.",
-                "notebook_id": notebook_id,
-            }
-        return {"status": "error", "error": "Failed to delete artifact"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if result:
+        return _ok(
+            message=f"Artifact {artifact_id} has been permanently deleted.",
+            notebook_id=notebook_id,
+        )
+    return _err("Failed to delete artifact")
 
 
 @mcp.tool()
-def infographic_create(
+@_tool_errors
+async def infographic_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     orientation: str = "landscape",
@@ -1196,89 +1612,15 @@ def infographic_create(
         focus_prompt: Optional focus text
         confirm: Must be True after user approval
     """
-    if not confirm:
-        return {
-            "status": "pending_confirmation",
-            "message": "Please confirm these settings before creating the infographic:",
-            "settings": {
-                "notebook_id": notebook_id,
-                "orientation": orientation,
-                "detail_level": detail_level,
-                "language": language,
-                "focus_prompt": focus_prompt or "(none)",
-                "source_ids": source_ids or "all sources",
-            },
-            "note": "Set confirm=True after user approves these settings.",
-        }
-
-    try:
-        client = get_client()
-
-        # Map orientation string to code
-        orientation_codes = {
-            "landscape": 1,
-            "portrait": 2,
-            "square": 3,
-        }
-        orientation_code = orientation_codes.get(orientation.lower())
-        if orientation_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown orientation '{orientation}'. Use: landscape, portrait, or square.",
-            }
-
-        # Map detail_level string to code
-        detail_codes = {
-            "concise": 1,
-            "standard": 2,
-            "detailed": 3,
-        }
-        detail_code = detail_codes.get(detail_level.lower())
-        if detail_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown detail_level '{detail_level}'. Use: concise, standard, or detailed.",
-            }
-
-        # Get source IDs if not provided
-        if source_ids is None:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s["id"]]
-
-        if not source_ids:
-            return {
-                "status": "error",
-                "error": "No sources found in notebook. Add sources before creating infographic.",
-            }
-
-        result = client.create_infographic(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            orientation_code=orientation_code,
-            detail_level_code=detail_code,
-            language=language,
-            focus_prompt=focus_prompt,
-        )
-
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "infographic",
-                "orientation": result["orientation"],
-                "detail_level": result["detail_level"],
-                "language": result["language"],
-                "generation_status": result["status"],
-                "message": "Infographic generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create infographic"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return await _create_artifact(
+        "infographic", notebook_id, source_ids, language, focus_prompt, confirm,
+        orientation=orientation, detail_level=detail_level,
+    )
 
 
 @mcp.tool()
-def slide_deck_create(
+@_tool_errors
+async def slide_deck_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     format: str = "detailed_deck",
@@ -1298,87 +1640,15 @@ def slide_deck_create(
         focus_prompt: Optional focus text
         confirm: Must be True after user approval
     """
-    if not confirm:
-        return {
-            "status": "pending_confirmation",
-            "message": "Please confirm these settings before creating the slide deck:",
-            "settings": {
-                "notebook_id": notebook_id,
-                "format": format,
-                "length": length,
-                "language": language,
-                "focus_prompt": focus_prompt or "(none)",
-                "source_ids": source_ids or "all sources",
-            },
-            "note": "Set confirm=True after user approves these settings.",
-        }
-
-    try:
-        client = get_client()
-
-        # Map format string to code
-        format_codes = {
-            "detailed_deck": 1,
-            "presenter_slides": 2,
-        }
-        format_code = format_codes.get(format.lower())
-        if format_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown format '{format}'. Use: detailed_deck or presenter_slides.",
-            }
-
-        # Map length string to code
-        length_codes = {
-            "short": 1,
-            "default": 3,
-        }
-        length_code = length_codes.get(length.lower())
-        if length_code is None:
-            return {
-                "status": "error",
-                "error": f"Unknown length '{length}'. Use: short or default.",
-            }
-
-        # Get source IDs if not provided
-        if source_ids is None:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s["id"]]
-
-        if not source_ids:
-            return {
-                "status": "error",
-                "error": "No sources found in notebook. Add sources before creating slide deck.",
-            }
-
-        result = client.create_slide_deck(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            format_code=format_code,
-            length_code=length_code,
-            language=language,
-            focus_prompt=focus_prompt,
-        )
-
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "slide_deck",
-                "format": result["format"],
-                "length": result["length"],
-                "language": result["language"],
-                "generation_status": result["status"],
-                "message": "Slide deck generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create slide deck"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return await _create_artifact(
+        "slide_deck", notebook_id, source_ids, language, focus_prompt, confirm,
+        format=format, length=length,
+    )
 
 
 @mcp.tool()
-def report_create(
+@_tool_errors
+async def report_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     report_format: str = "Briefing Doc",
@@ -1410,40 +1680,35 @@ def report_create(
             "note": "Set confirm=True after user approves these settings.",
         }
 
-    try:
-        client = get_client()
-
-        # Get source IDs if not provided
-        if not source_ids:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s.get("id")]
-
-        result = client.create_report(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            report_format=report_format,
-            custom_prompt=custom_prompt,
-            language=language,
-        )
+    client = await _call(get_client)
 
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "report",
-                "format": result["format"],
-                "language": result["language"],
-                "generation_status": result["status"],
-                "message": "Report generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create report"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    # Get source IDs if not provided
+    if not source_ids:
+        source_ids = await _default_source_ids(client, notebook_id)
+
+    result = await _call(
+        client.create_report,
+        notebook_id=notebook_id,
+        source_ids=source_ids,
+        report_format=report_format,
+        custom_prompt=custom_prompt,
+        language=language,
+    )
+
+    return _ok(
+        artifact_id=result["artifact_id"],
+        type="report",
+        format=result["format"],
+        language=result["language"],
+        generation_status=result["status"],
+        message="Report generation started. Use studio_status to check progress.",
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
 
 
 @mcp.tool()
-def flashcards_create(
+@_tool_errors
+async def flashcards_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     difficulty: str = "medium",
@@ -1469,37 +1734,32 @@ def flashcards_create(
             "note": "Set confirm=True after user approves these settings.",
         }
 
-    try:
-        client = get_client()
+    client = await _call(get_client)
 
-        # Get source IDs if not provided
-        if not source_ids:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s.get("id")]
+    # Get source IDs if not provided
+    if not source_ids:
+        source_ids = await _default_source_ids(client, notebook_id)
 
-        result = client.create_flashcards(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            difficulty=difficulty,
-        )
+    result = await _call(
+        client.create_flashcards,
+        notebook_id=notebook_id,
+        source_ids=source_ids,
+        difficulty=difficulty,
+    )
 
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "flashcards",
-                "difficulty": result["difficulty"],
-                "generation_status": result["status"],
-                "message": "Flashcards generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create flashcards"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _ok(
+        artifact_id=result["artifact_id"],
+        type="flashcards",
+        difficulty=result["difficulty"],
+        generation_status=result["status"],
+        message="Flashcards generation started. Use studio_status to check progress.",
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
 
 
 @mcp.tool()
-def quiz_create(
+@_tool_errors
+async def quiz_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     question_count: int = 2,
@@ -1528,38 +1788,33 @@ def quiz_create(
             "note": "Set confirm=True after user approves these settings.",
         }
 
-    try:
-        client = get_client()
-
-        if not source_ids:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s.get("id")]
-
-        result = client.create_quiz(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            question_count=question_count,
-            difficulty=difficulty,
-        )
+    client = await _call(get_client)
 
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "quiz",
-                "question_count": result["question_count"],
-                "difficulty": result["difficulty"],
-                "generation_status": result["status"],
-                "message": "Quiz generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create quiz"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if not source_ids:
+        source_ids = await _default_source_ids(client, notebook_id)
+
+    result = await _call(
+        client.create_quiz,
+        notebook_id=notebook_id,
+        source_ids=source_ids,
+        question_count=question_count,
+        difficulty=difficulty,
+    )
+
+    return _ok(
+        artifact_id=result["artifact_id"],
+        type="quiz",
+        question_count=result["question_count"],
+        difficulty=result["difficulty"],
+        generation_status=result["status"],
+        message="Quiz generation started. Use studio_status to check progress.",
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
 
 
 @mcp.tool()
-def data_table_create(
+@_tool_errors
+async def data_table_create(
     notebook_id: str,
     description: str,
     source_ids: list[str] | None = None,
@@ -1588,37 +1843,32 @@ def data_table_create(
             "note": "Set confirm=True after user approves these settings.",
         }
 
-    try:
-        client = get_client()
-
-        if not source_ids:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s.get("id")]
+    client = await _call(get_client)
 
-        result = client.create_data_table(
-            notebook_id=notebook_id,
-            source_ids=source_ids,
-            description=description,
-            language=language,
-        )
-
-        if result:
-            return {
-                "status": "success",
-                "artifact_id": result["artifact_id"],
-                "type": "data_table",
-                "description": result["description"],
-                "generation_status": result["status"],
-                "message": "Data table generation started. Use studio_status to check progress.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to create data table"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    if not source_ids:
+        source_ids = await _default_source_ids(client, notebook_id)
+
+    result = await _call(
+        client.create_data_table,
+        notebook_id=notebook_id,
+        source_ids=source_ids,
+        description=description,
+        language=language,
+    )
+
+    return _ok(
+        artifact_id=result["artifact_id"],
+        type="data_table",
+        description=result["description"],
+        generation_status=result["status"],
+        message="Data table generation started. Use studio_status to check progress.",
+        notebook_url=_NB_URL_PREFIX + notebook_id,
+    )
 
 
 @mcp.tool()
-def mind_map_create(
+@_tool_errors
+async def mind_map_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
     title: str = "Mind Map",
@@ -1644,94 +1894,75 @@ def mind_map_create(
             "note": "Set confirm=True after user approves these settings.",
         }
 
-    try:
-        client = get_client()
-
-        # Get source IDs if not provided
-        if not source_ids:
-            sources = client.get_notebook_sources_with_types(notebook_id)
-            source_ids = [s["id"] for s in sources if s.get("id")]
-
-        # Step 1: Generate the mind map
-        gen_result = client.generate_mind_map(source_ids=source_ids)
-        if not gen_result or not gen_result.get("mind_map_json"):
-            return {"status": "error", "error": "Failed to generate mind map"}
+    client = await _call(get_client)
 
-        # Step 2: Save the mind map to the notebook
-        save_result = client.save_mind_map(
+    # Get source IDs if not provided
+    if not source_ids:
+        source_ids = await _default_source_ids(client, notebook_id)
+
+    # Step 1: Generate the mind map
+    gen_result = await _call(client.generate_mind_map, source_ids=source_ids)
+    if not gen_result or not gen_result.get("mind_map_json"):
+        return _err("Failed to generate mind map")
+
+    # Step 2: Save the mind map to the notebook
+    save_result = await _call(
+        client.save_mind_map,
+        notebook_id=notebook_id,
+        mind_map_json=gen_result["mind_map_json"],
+        source_ids=source_ids,
+        title=title,
+    )
+
+    if save_result:
+        # Parse the JSON to get structure info
+        try:
+            mind_map_data = json.loads(save_result.get("mind_map_json", "{}"))
+            root_name = mind_map_data.get("name", "Unknown")
+            children_count = len(mind_map_data.get("children", []))
+        except json.JSONDecodeError:
+            root_name = "Unknown"
+            children_count = 0
+
+        return _ok(
+            mind_map_id=save_result["mind_map_id"],
             notebook_id=notebook_id,
-            mind_map_json=gen_result["mind_map_json"],
-            source_ids=source_ids,
-            title=title,
+            title=save_result.get("title", title),
+            root_name=root_name,
+            children_count=children_count,
+            message="Mind map created and saved successfully.",
+            notebook_url=_NB_URL_PREFIX + notebook_id,
         )
-
-        if save_result:
-            # Parse the JSON to get structure info
-            import json
-            try:
-                mind_map_data = json.loads(save_result.get("mind_map_json", "{}"))
-                root_name = mind_map_data.get("name", "Unknown")
-                children_count = len(mind_map_data.get("children", []))
-            except json.JSONDecodeError:
-                root_name = "Unknown"
-                children_count = 0
-
-            return {
-                "status": "success",
-                "mind_map_id": save_result["mind_map_id"],
-                "notebook_id": notebook_id,
-                "title": save_result.get("title", title),
-                "root_name": root_name,
-                "children_count": children_count,
-                "message": "Mind map created and saved successfully.",
-                "notebook_url": f"https://notebooklm.google.com/notebook/{notebook_id}",
-            }
-        return {"status": "error", "error": "Failed to save mind map"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    return _err("Failed to save mind map")
 
 
 @mcp.tool()
-def mind_map_list(notebook_id: str) -> dict[str, Any]:
+@_tool_errors
+async def mind_map_list(notebook_id: str) -> dict[str, Any]:
     """List all mind maps in a notebook.
 
     Args:
         notebook_id: Notebook UUID
     """
-    try:
-        client = get_client()
-        mind_maps = client.list_mind_maps(notebook_id)
-
-        return {
-            "status": "success",
-            "count": len(mind_maps),
-            "mind_maps": [
-                {
-                    "mind_map_id": mm.get("mind_map_id"),
-                    "title": mm.get("title", "Untitled"),
-                    "created_at": mm.get("created_at"),
-                }
-                for mm in mind_maps
-            ],
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
-
-
-# Essential cookies for NotebookLM API authentication
-# Only these are needed - no need to save all 20+ cookies from the browser
-ESSENTIAL_COOKIES = [
-    "SID", "HSID", "SSID", "APISID", "SAPISID",  # Core auth cookies
-    "__Secure-1PSID", "__Secure-3PSID",  # Secure session variants
-    "__Secure-1PAPISID", "__Secure-3PAPISID",  # Secure API variants
-    "OSID", "__Secure-OSID",  # Origin-bound session
-    "__Secure-1PSIDTS", "__Secure-3PSIDTS",  # Timestamp tokens (rotate frequently)
-    "SIDCC", "__Secure-1PSIDCC", "__Secure-3PSIDCC",  # Session cookies (rotate frequently)
-]
+    client = await _call(get_client)
+    mind_maps = await _call(client.list_mind_maps, notebook_id)
+
+    return _ok(
+        count=len(mind_maps),
+        mind_maps=[
+            {
+                "mind_map_id": mm.get("mind_map_id"),
+                "title": mm.get("title", "Untitled"),
+                "created_at": mm.get("created_at"),
+            }
+            for mm in mind_maps
+        ],
+    )
 
 
 @mcp.tool()
-def save_auth_tokens(
+@_tool_errors
+async def save_auth_tokens(
     cookies: str,
     csrf_token: str = "",
     session_id: str = "",
@@ -1747,86 +1978,81 @@ def save_auth_tokens(
         request_body: Optional request body from get_network_request (contains CSRF token)
         request_url: Optional request URL from get_network_request (contains session ID)
     """
-    global _client
-
-    try:
-        import time
-        import urllib.parse
-        from .auth import AuthTokens, save_tokens_to_cache
-
-        # Parse cookie string to dict
-        all_cookies = {}
-        for part in cookies.split("; "):
-            if "=" in part:
-                key, value = part.split("=", 1)
-                all_cookies[key] = value
-
-        # Validate required cookies
-        required = ["SID", "HSID", "SSID", "APISID", "SAPISID"]
-        missing = [c for c in required if c not in all_cookies]
-        if missing:
-            return {
-                "status": "error",
-                "error": f"Missing required cookies: {missing}",
-            }
-
-        # Filter to only essential cookies (reduces noise significantly)
-        cookie_dict = {k: v for k, v in all_cookies.items() if k in ESSENTIAL_COOKIES}
-
-        # Try to extract CSRF token from request body if provided
-        if not csrf_token and request_body:
-            # Request body format: f.req=...&at=<csrf_token>&
-            if "at=" in request_body:
-                # Extract and URL-decode the CSRF token
-                at_part = request_body.split("at=")[1].split("&")[0]
-                csrf_token = urllib.parse.unquote(at_part)
-
-        # Try to extract session ID from request URL if provided
-        if not session_id and request_url:
-            # URL format: ...?f.sid=<session_id>&...
-            if "f.sid=" in request_url:
-                sid_part = request_url.split("f.sid=")[1].split("&")[0]
-                session_id = urllib.parse.unquote(sid_part)
-
-        # Create and save tokens
-        # Note: csrf_token and session_id will be auto-extracted from page on first use if still empty
-        tokens = AuthTokens(
-            cookies=cookie_dict,
-            csrf_token=csrf_token,  # May be empty - will be auto-extracted from page
-            session_id=session_id,  # May be empty - will be auto-extracted from page
-            extracted_at=time.time(),
-        )
-        save_tokens_to_cache(tokens)
-
-        # Reset client so next call uses fresh tokens
-        _client = None
-
-        from .auth import get_cache_path
-
-        # Build status message
-        if csrf_token and session_id:
-            token_msg = "CSRF token and session ID extracted from network request - no page fetch needed! ⚡"
-        elif csrf_token:
-            token_msg = "CSRF token extracted from network request. Session ID will be auto-extracted on first use."
-        elif session_id:
-            token_msg = "Session ID extracted from network request. CSRF token will be auto-extracted on first use."
-        else:
-            token_msg = "CSRF token and session ID will be auto-extracted on first API call (~1-2s one-time delay)."
-
-        return {
-            "status": "success",
-            "message": f"Saved {len(cookie_dict)} essential cookies (filtered from {len(all_cookies)}). {token_msg}",
-            "cache_path": str(get_cache_path()),
-            "extracted_csrf": bool(csrf_token),
-            "extracted_session_id": bool(session_id),
-        }
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    # Parse the cookie string, keeping only essential cookies (reduces
+    # noise significantly) - the required ones are among them
+    cookie_dict = extract_cookies_from_chrome_export(cookies, ESSENTIAL_COOKIES)
+    cookie_count = sum(1 for part in cookies.split(";") if "=" in part)
+
+    # Validate required cookies
+    missing = REQUIRED_COOKIES.difference(cookie_dict)
+    if missing:
+        return _err(f"Missing required cookies: {sorted(missing)}")
+
+    # Try to extract CSRF token from request body if provided
+    if not csrf_token and request_body:
+        # Request body format: f.req=...&at=<csrf_token>&
+        if "at=" in request_body:
+            # Extract and URL-decode the CSRF token
+            at_part = request_body.split("at=")[1].split("&")[0]
+            csrf_token = urllib.parse.unquote(at_part)
+
+    # Try to extract session ID from request URL if provided
+    if not session_id and request_url:
+        # URL format: ...?f.sid=<session_id>&...
+        if "f.sid=" in request_url:
+            sid_part = request_url.split("f.sid=")[1].split("&")[0]
+            session_id = urllib.parse.unquote(sid_part)
+
+    # Create and save tokens
+    # Note: csrf_token and session_id will be auto-extracted from page on first use if still empty
+    tokens = AuthTokens(
+        cookies=cookie_dict,
+        csrf_token=csrf_token,  # May be empty - will be auto-extracted from page
+        session_id=session_id,  # May be empty - will be auto-extracted from page
+        extracted_at=time.time(),
+    )
+    await _call(save_tokens_to_cache, tokens)
+
+    # Switch the client to the new tokens (possibly another account),
+    # keeping its pooled connections
+    client = _client
+    if client is not None:
+        client.set_tokens(cookie_dict, csrf_token=csrf_token, session_id=session_id)
+    _invalidate_notebook()
+    _freshness_cache.clear()
+    _research_cache.clear()
+
+    # Build status message
+    if csrf_token and session_id:
+        token_msg = "CSRF token and session ID extracted from network request - no page fetch needed! ⚡"
+    elif csrf_token:
+        token_msg = "CSRF token extracted from network request. Session ID will be auto-extracted on first use."
+    elif session_id:
+        token_msg = "Session ID extracted from network request. CSRF token will be auto-extracted on first use."
+    else:
+        token_msg = "CSRF token and session ID will be auto-extracted on first API call (~1-2s one-time delay)."
+
+    return _ok(
+        message=f"Saved {len(cookie_dict)} essential cookies (filtered from {cookie_count}). {token_msg}",
+        cache_path=str(get_cache_path()),
+        extracted_csrf=bool(csrf_token),
+        extracted_session_id=bool(session_id),
+    )
 
 
 def main():
     """Run the MCP server."""
-    mcp.run()
+    # Build the client (reading cached auth) before the first tool call
+    # arrives. Without auth yet, tools report it when called
+    try:
+        get_client()
+    except Exception:
+        pass
+
+    try:
+        mcp.run()
+    finally:
+        _close_client()
     return 0
 
 
@@ -0,0 +1,56 @@
+"""Tests for NotebookLMClient auth token handling and cookie parsing."""
+
+import httpx
+
+from notebooklm_mcp.api_client import NotebookLMClient, extract_cookies_from_chrome_export
+
+
+def make_client(requests: list[httpx.Request]) -> NotebookLMClient:
+    """Client whose HTTP traffic is recorded and answered locally."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text='"SNlM0e":"PAGE_CSRF","FdrFJe":"PAGE_SID"')
+
+    client = NotebookLMClient({"SID": "a"}, "csrf", "sid")
+    client._update_cached_tokens = lambda: None
+    client._get_client()._transport = httpx.MockTransport(handler)
+    return client
+
+
+def test_set_tokens_with_full_tokens_clears_invalidation():
+    requests: list[httpx.Request] = []
+    client = make_client(requests)
+
+    client.invalidate_auth()
+    client.set_tokens({"SID": "b"}, "new_csrf", "new_sid")
+    client._ensure_auth_tokens()
+
+    assert requests == []
+    assert client.csrf_token == "new_csrf"
+    assert client._session_id == "new_sid"
+
+
+def test_set_tokens_without_csrf_refreshes_from_page():
+    requests: list[httpx.Request] = []
+    client = make_client(requests)
+
+    client.set_tokens({"SID": "b"})
+    client._ensure_auth_tokens()
+
+    assert [request.method for request in requests] == ["GET"]
+    assert requests[0].headers["Cookie"] == "SID=b"
+    assert client.csrf_token == "PAGE_CSRF"
+    assert client._session_id == "PAGE_SID"
+
+
+def test_extract_cookies_strips_padding():
+    cookies = extract_cookies_from_chrome_export(" SID= v ;HSID =w;  NID=x=y;OTHER=")
+
+    assert cookies == {"SID": "v", "HSID": "w", "NID": "x=y", "OTHER": ""}
+
+
+def test_extract_cookies_filters_names():
+    cookies = extract_cookies_from_chrome_export("SID= v; OTHER=1", frozenset({"SID"}))
+
+    assert cookies == {"SID": "v"}